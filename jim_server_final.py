@@ -1,32 +1,203 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import json
+import sqlite3
+import string
+import gzip
+import hashlib
+import uuid
+import functools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from openai import OpenAI
 from dotenv import load_dotenv
+import httpx
 import socket
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 import webbrowser
 
 load_dotenv()
 
+# orjson serializes/parses several times faster than stdlib json; fall
+# back silently when it isn't installed
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Compiled once at import; clean_text_for_speech runs on every voiced response.
+# All markdown forms are fused into one alternation so the text is scanned
+# once instead of once per pattern (cleanup is memory-bound, passes dominate)
+_RE_MARKDOWN = re.compile(
+    r'```.*?```'                      # code blocks (dropped)
+    r'|\*\*(.*?)\*\*'                 # **bold**
+    r'|\*(.*?)\*'                     # *italic*
+    r'|__(.*?)__'                     # __underline__
+    r'|_(.*?)_'                       # _italic_
+    r'|`([^`]+)`'                     # inline code
+    r'|\[([^\]]+)\]\([^)]+\)'         # links, keep text
+    r'|#{1,6}\s+',                    # headers (dropped)
+    re.DOTALL)
+_RE_QUOTED = re.compile(r'"([^"]*)"')
+_RE_PUNCT = re.compile(r'([•·–—])|(\.{2,})|(\s+)')
+_QUOTE_TRANS = str.maketrans({'‘': "'", '’': "'", '“': '"', '”': '"'})
+
+# Strips punctuation before tokenizing so "goals?" and "goals" index the
+# same word
+_PUNCT_TRANS = str.maketrans('', '', string.punctuation)
+
+# One pooled HTTP client shared by every OpenAI call so warm TLS
+# connections are reused instead of re-established per request
+_HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+
+# TTS runs per sentence while GPT is still streaming; a small pool keeps
+# the concurrent ElevenLabs calls bounded
+_TTS_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Bounded pool for /ask work: handler threads queue here so a burst of
+# requests can't fan out into unbounded concurrent API calls
+_ASK_POOL = ThreadPoolExecutor(max_workers=16)
+
+# Schema-constrained analysis output: the model can't wrap the JSON in
+# prose, so a parse failure never wastes a completed call
+_ANALYSIS_PROPERTIES = {
+    "themes": {"type": "array", "items": {"type": "string"}, "maxItems": 3},
+    "growth_areas": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+    "goals": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+    "challenges": {"type": "array", "items": {"type": "string"}, "maxItems": 2},
+    "insights": {"type": "array", "items": {"type": "string"}, "maxItems": 1},
+}
+_ANALYSIS_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "profile_update",
+        "schema": {
+            "type": "object",
+            "properties": _ANALYSIS_PROPERTIES,
+            "required": list(_ANALYSIS_PROPERTIES),
+        },
+    },
+}
+_BATCH_ANALYSIS_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "profile_update_batch",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": _ANALYSIS_PROPERTIES,
+                        "required": list(_ANALYSIS_PROPERTIES),
+                    },
+                }
+            },
+            "required": ["results"],
+        },
+    },
+}
+
+@functools.lru_cache(maxsize=256)
+def _clean_text_for_speech(text: str) -> str:
+    """Clean text for better speech synthesis by removing markdown and formatting."""
+    # Remove all markdown in a single fused scan
+    text = _RE_MARKDOWN.sub(_markdown_sub, text)
+    
+    # Clean up quotation marks for speech
+    text = _RE_QUOTED.sub(r'"\1"', text)      # Standardize quotes
+    text = text.translate(_QUOTE_TRANS)       # Convert smart quotes in one pass
+    
+    # Normalize dashes, dot runs and whitespace in one more scan
+    text = _RE_PUNCT.sub(_punct_sub, text)
+    
+    # Remove common problematic characters
+    text = text.replace(':', ': ')                # Ensure space after colons
+    text = text.replace(';', '. ')                # Replace semicolons with periods
+    text = text.replace('&', 'and')               # Replace ampersands
+    
+    return text.strip()
+
+
+def _markdown_sub(match):
+    """Keep the first captured inner text; bare matches are dropped."""
+    for group in match.groups():
+        if group is not None:
+            return group
+    return ''
+
+def _punct_sub(match):
+    if match.group(1):
+        return '-'   # special dashes
+    if match.group(2):
+        return '.'   # runs of dots
+    return ' '       # runs of whitespace
+
 class JimRohnCoach:
     def __init__(self):
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.conversations = []
+        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"),
+                                    http_client=_HTTP_CLIENT)
+        self.conversations = deque(maxlen=200)
+        
+        # Guards profile updates and disk writes from the background worker
+        self._memory_lock = threading.Lock()
+        
+        # Turns waiting for pattern analysis; one worker drains them in a
+        # single batched completion instead of one GPT call per turn
+        self._pending_analyses = []
+        self._analysis_event = threading.Event()
+        threading.Thread(target=self._analysis_worker, daemon=True).start()
         
         # Memory system files
-        self.conversation_history_file = "conversation_history.json"
+        self.conversation_history_file = "conversation_history.jsonl"
         self.user_profile_file = "user_profile.json"
         
-        # Load existing data
-        self.conversation_history = self.load_conversation_history()
+        # Load existing data; bounded in memory, unbounded on disk via
+        # the JSONL append in save_memory
+        self.conversation_history = deque(self.load_conversation_history(), maxlen=5000)
         self.user_profile = self.load_user_profile()
         
+        # Full-text index over the entire history: FTS5 answers "similar
+        # past conversation" lookups in C, regardless of history size
+        self._db = sqlite3.connect("convos.db", isolation_level=None,
+                                   check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS convos "
+                         "USING fts5(question, response, ts UNINDEXED)")
+        if (self.conversation_history
+                and self._db.execute("SELECT count(*) FROM convos").fetchone()[0] == 0):
+            # One-time seed from the JSONL history
+            self._db.executemany(
+                "INSERT INTO convos VALUES (?, ?, ?)",
+                [(c.get("question", ""), c.get("response", ""), c.get("timestamp", ""))
+                 for c in self.conversation_history])
+        
+        self._context_cache = {}
+        self._last_ctx_hash = None
+        self._cached_enhanced_prompt = None
+        
+        # Set mirrors of the capped profile lists for O(1) dedupe checks
+        self._profile_seen = {
+            key: set(self.user_profile.get(key, []))
+            for key in ("recurring_themes", "growth_areas", "goals", "challenges")
+        }
+        
         # Load the system prompt
         try:
             with open('System prompt.txt', 'r') as f:
@@ -41,45 +212,25 @@ class JimRohnCoach:
         print(f"🧠 User profile: {len(self.user_profile.get('recurring_themes', []))} themes tracked")
     
     def clean_text_for_speech(self, text: str) -> str:
-        """Clean text for better speech synthesis by removing markdown and formatting."""
-        import re
-        
-        # Remove markdown formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove **bold**
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # Remove *italic*
-        text = re.sub(r'__(.*?)__', r'\1', text)      # Remove __underline__
-        text = re.sub(r'_(.*?)_', r'\1', text)        # Remove _italic_
-        
-        # Remove other markdown elements
-        text = re.sub(r'#{1,6}\s+', '', text)         # Remove headers
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)  # Remove code blocks
-        text = re.sub(r'`([^`]+)`', r'\1', text)      # Remove inline code
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # Remove links, keep text
-        
-        # Clean up quotation marks for speech
-        text = re.sub(r'"([^"]*)"', r'"\1"', text)    # Standardize quotes
-        text = text.replace(''', "'")                 # Convert smart quotes
-        text = text.replace(''', "'")                 # Convert smart quotes
-        text = text.replace('"', '"')                 # Convert smart quotes
-        text = text.replace('"', '"')                 # Convert smart quotes
-        
-        # Remove excessive punctuation
-        text = re.sub(r'[•·–—]', '-', text)           # Replace special dashes
-        text = re.sub(r'\.{2,}', '.', text)           # Replace multiple dots
-        text = re.sub(r'\s+', ' ', text)              # Replace multiple spaces
-        
-        # Remove common problematic characters
-        text = text.replace(':', ': ')                # Ensure space after colons
-        text = text.replace(';', '. ')                # Replace semicolons with periods
-        text = text.replace('&', 'and')               # Replace ampersands
-        
-        return text.strip()
+        """Clean text for better speech synthesis (cached per unique text)."""
+        return _clean_text_for_speech(text)
     
     def load_conversation_history(self):
-        """Load conversation history from JSON file."""
+        """Load conversation history from the append-only JSONL file."""
         try:
             with open(self.conversation_history_file, 'r') as f:
-                return json.load(f)
+                return [_json_loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            pass
+        
+        # One-time migration from the old full-rewrite JSON format
+        try:
+            with open("conversation_history.json", 'r') as f:
+                history = json.load(f)
+            with open(self.conversation_history_file, 'w') as f:
+                for convo in history:
+                    f.write(json.dumps(convo) + "\n")
+            return history
         except FileNotFoundError:
             return []
     
@@ -104,13 +255,34 @@ class JimRohnCoach:
     
     def save_memory(self):
         """Save both conversation history and user profile."""
-        # Save conversation history
-        with open(self.conversation_history_file, 'w') as f:
-            json.dump(self.conversation_history, f, indent=2)
+        # Append only the newest conversation instead of rewriting the
+        # whole history file every turn
+        if self.conversation_history:
+            with open(self.conversation_history_file, 'a') as f:
+                f.write(_json_dumps(self.conversation_history[-1]) + "\n")
         
-        # Save user profile
-        with open(self.user_profile_file, 'w') as f:
+        self._save_profile()
+    
+    def _save_profile(self):
+        """Atomically rewrite the (small) user profile file."""
+        tmp_file = self.user_profile_file + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(self.user_profile, f, indent=2)
+        os.replace(tmp_file, self.user_profile_file)
+    
+    def _profile_brief(self):
+        """Compact profile summary for the analysis prompt."""
+        profile = self.user_profile
+        lines = []
+        if profile.get("name"):
+            lines.append(f"Name: {profile['name']}")
+        if profile.get("recurring_themes"):
+            lines.append(f"Recent themes: {', '.join(profile['recurring_themes'][-5:])}")
+        if profile.get("growth_areas"):
+            lines.append(f"Growth areas: {', '.join(profile['growth_areas'][-3:])}")
+        if profile.get("goals"):
+            lines.append(f"Goals: {', '.join(profile['goals'][-3:])}")
+        return "\n".join(lines) if lines else "No profile yet"
     
     def analyze_conversation_patterns(self, user_question: str, jim_response: str):
         """Analyze conversation to extract themes and patterns."""
@@ -121,7 +293,8 @@ class JimRohnCoach:
             User Question: "{user_question}"
             Jim's Response: "{jim_response}"
             
-            Current user profile: {json.dumps(self.user_profile, indent=2)}
+            Current user profile:
+            {self._profile_brief()}
             
             Extract and return JSON with:
             1. "themes" - Key themes from this conversation (max 3)
@@ -133,48 +306,129 @@ class JimRohnCoach:
             Keep responses concise and focus on actionable items.
             """
             
+            # Short structured extraction doesn't need gpt-4; the mini
+            # model is faster and an order of magnitude cheaper here
             response = self.openai_client.chat.completions.create(
-                model="gpt-4",
+                model="gpt-4o-mini",
                 messages=[{"role": "system", "content": analysis_prompt}],
                 temperature=0.3,
-                max_tokens=300
+                max_tokens=300,
+                response_format=_ANALYSIS_SCHEMA
             )
             
-            analysis = json.loads(response.choices[0].message.content)
-            
-            # Update user profile with new insights
-            for theme in analysis.get("themes", []):
-                if theme not in self.user_profile["recurring_themes"]:
-                    self.user_profile["recurring_themes"].append(theme)
-            
-            for area in analysis.get("growth_areas", []):
-                if area not in self.user_profile["growth_areas"]:
-                    self.user_profile["growth_areas"].append(area)
-            
-            for goal in analysis.get("goals", []):
-                if goal not in self.user_profile["goals"]:
-                    self.user_profile["goals"].append(goal)
-                    
-            for challenge in analysis.get("challenges", []):
-                if challenge not in self.user_profile["challenges"]:
-                    self.user_profile["challenges"].append(challenge)
-            
-            for insight in analysis.get("insights", []):
-                self.user_profile["insights"].append(insight)
-            
-            # Keep lists manageable (last 10 items)
-            for key in ["recurring_themes", "growth_areas", "goals", "challenges"]:
-                if key in self.user_profile:
-                    self.user_profile[key] = self.user_profile[key][-10:]
-            
-            # Keep last 5 insights
-            self.user_profile["insights"] = self.user_profile["insights"][-5:]
+            analysis = _json_loads(response.choices[0].message.content)
+            self._apply_analysis(analysis)
             
         except Exception as e:
             print(f"⚠️ Pattern analysis failed: {e}")
     
+    def _apply_analysis(self, analysis):
+        """Fold one conversation's extracted patterns into the profile."""
+        # Update user profile with new insights; the set mirrors make
+        # each membership check O(1) instead of a list scan
+        updates = [("themes", "recurring_themes"), ("growth_areas", "growth_areas"),
+                   ("goals", "goals"), ("challenges", "challenges")]
+        for analysis_key, profile_key in updates:
+            seen = self._profile_seen[profile_key]
+            for item in analysis.get(analysis_key, []):
+                if item not in seen:
+                    seen.add(item)
+                    self.user_profile[profile_key].append(item)
+        
+        for insight in analysis.get("insights", []):
+            self.user_profile["insights"].append(insight)
+        
+        # Keep lists manageable (last 10 items), resyncing the mirrors
+        # only when something actually falls off
+        for key in ["recurring_themes", "growth_areas", "goals", "challenges"]:
+            if key in self.user_profile and len(self.user_profile[key]) > 10:
+                self.user_profile[key] = self.user_profile[key][-10:]
+                self._profile_seen[key] = set(self.user_profile[key])
+        
+        # Keep last 5 insights
+        self.user_profile["insights"] = self.user_profile["insights"][-5:]
+    
+    def _analyze_batch(self, batch):
+        """Analyze several queued conversations in one completion."""
+        numbered_block = "\n\n".join(
+            f'Conversation {i + 1}:\nUser Question: "{q}"\nJim\'s Response: "{r}"'
+            for i, (q, r) in enumerate(batch))
+        
+        batch_prompt = f"""
+        Analyze each numbered conversation below for themes and patterns.
+        
+        {numbered_block}
+        
+        Current user profile:
+        {self._profile_brief()}
+        
+        Return JSON: {{"results": [one object per conversation, in order]}}.
+        Each object must have:
+        1. "themes" - Key themes from that conversation (max 3)
+        2. "growth_areas" - Areas where user needs development (max 2)
+        3. "goals" - Any goals mentioned or implied (max 2)
+        4. "challenges" - Challenges user is facing (max 2)
+        5. "insights" - Key insights about the user (max 1)
+        
+        Keep responses concise and focus on actionable items.
+        """
+        
+        response = self.openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "system", "content": batch_prompt}],
+            temperature=0.3,
+            max_tokens=300 * len(batch),
+            response_format=_BATCH_ANALYSIS_SCHEMA
+        )
+        
+        results = _json_loads(response.choices[0].message.content).get("results", [])
+        for analysis in results:
+            self._apply_analysis(analysis)
+    
+    def _analysis_worker(self):
+        """Drain queued turns through one batched analysis call."""
+        while True:
+            self._analysis_event.wait()
+            time.sleep(2)  # let a burst of turns accumulate
+            self._analysis_event.clear()
+            batch, self._pending_analyses = self._pending_analyses, []
+            if not batch:
+                continue
+            try:
+                with self._memory_lock:
+                    if len(batch) == 1:
+                        self.analyze_conversation_patterns(*batch[0])
+                    else:
+                        self._analyze_batch(batch)
+                    self._context_cache.clear()  # profile summaries feed the context
+                    self._save_profile()
+            except Exception as e:
+                print(f"⚠️ Batched pattern analysis failed: {e}")
+    
+    def _analyze_and_save(self, question: str, jim_response: str, timestamp: str):
+        """Persist the turn and queue it for batched pattern analysis."""
+        with self._memory_lock:
+            self.user_profile["total_conversations"] = len(self.conversation_history)
+            self.user_profile["last_conversation"] = timestamp
+            if not self.user_profile.get("first_conversation"):
+                self.user_profile["first_conversation"] = timestamp
+            self.save_memory()
+        
+        with self._db_lock:
+            self._db.execute("INSERT INTO convos VALUES (?, ?, ?)",
+                             (question, jim_response, timestamp))
+        
+        self._pending_analyses.append((question, jim_response))
+        self._analysis_event.set()
+    
     def get_conversation_context(self, current_question: str):
         """Get relevant context from past conversations."""
+        # Re-asked questions reuse the last answer; the cache is cleared
+        # whenever history or the profile changes
+        cached = self._context_cache.get(current_question)
+        if cached is not None:
+            return cached
+        
         context = []
         
         # Add user profile summary
@@ -187,24 +441,30 @@ class JimRohnCoach:
         if self.user_profile.get("goals"):
             context.append(f"Current goals: {', '.join(self.user_profile['goals'][-3:])}")
         
-        # Search recent conversations for similar topics
-        recent_conversations = self.conversation_history[-10:]  # Last 10 conversations
+        # Search the whole history for similar topics through the FTS
+        # index; ranking and matching happen in C inside SQLite
+        current_words = set(current_question.lower().translate(_PUNCT_TRANS).split())
+        fts_query = " OR ".join(w for w in current_words if w.isalnum())
         relevant_convos = []
-        
-        current_words = current_question.lower().split()
-        for convo in recent_conversations:
-            question_words = convo.get("question", "").lower().split()
-            # Simple word overlap check
-            overlap = len(set(current_words) & set(question_words))
-            if overlap >= 2:  # If 2+ words match
-                relevant_convos.append(convo)
+        if fts_query:
+            try:
+                with self._db_lock:
+                    relevant_convos = self._db.execute(
+                        "SELECT question, response FROM convos WHERE convos MATCH ? "
+                        "ORDER BY rank LIMIT 2", (fts_query,)).fetchall()
+            except sqlite3.OperationalError:
+                pass  # pathological token stream; skip history context
         
         if relevant_convos:
             context.append("Recent similar conversations:")
-            for convo in relevant_convos[-2:]:  # Last 2 relevant
-                context.append(f"- Q: {convo['question'][:100]}... A: {convo['response'][:150]}...")
+            for convo_question, convo_response in relevant_convos:
+                context.append(f"- Q: {convo_question[:100]}... A: {convo_response[:150]}...")
         
-        return "\n".join(context) if context else ""
+        result = "\n".join(context) if context else ""
+        if len(self._context_cache) > 256:
+            self._context_cache.clear()
+        self._context_cache[current_question] = result
+        return result
     
     def ask_jim(self, question: str, generate_voice: bool = True) -> dict:
         """Get Jim's response to a question."""
@@ -212,56 +472,88 @@ class JimRohnCoach:
             # Get conversation context from memory
             context = self.get_conversation_context(question)
             
-            # Build enhanced system prompt with memory context
-            enhanced_prompt = self.system_prompt
+            # Build enhanced system prompt with memory context; identical
+            # context between turns reuses the previous concatenation. The
+            # stable system-prompt prefix also keeps provider-side prompt
+            # caching effective, since only the tail varies.
             if context:
-                enhanced_prompt += f"\n\n=== MEMORY CONTEXT ===\n{context}\n\nUse this context to provide more personalized advice. Reference past conversations when relevant, but don't make it obvious unless it naturally fits the conversation."
+                ctx_hash = hash(context)
+                if ctx_hash != self._last_ctx_hash:
+                    self._cached_enhanced_prompt = self.system_prompt + f"\n\n=== MEMORY CONTEXT ===\n{context}\n\nUse this context to provide more personalized advice. Reference past conversations when relevant, but don't make it obvious unless it naturally fits the conversation."
+                    self._last_ctx_hash = ctx_hash
+                enhanced_prompt = self._cached_enhanced_prompt
+            else:
+                enhanced_prompt = self.system_prompt
             
-            response = self.openai_client.chat.completions.create(
+            # Voice setup happens before the completion so TTS can start
+            # on early sentences while GPT is still generating the rest
+            print(f"🎤 Voice generation requested: {generate_voice}")
+            print(f"🔑 API Key available: {bool(os.getenv('ELEVENLABS_API_KEY'))}")
+            print(f"🗣️ Voice ID available: {bool(os.getenv('JIM_ROHN_VOICE_ID'))}")
+            
+            elevenlabs_client = None
+            if generate_voice and os.getenv("ELEVENLABS_API_KEY") and os.getenv("JIM_ROHN_VOICE_ID"):
+                try:
+                    from elevenlabs import ElevenLabs
+                    elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+                except Exception as voice_error:
+                    print(f"⚠️ Voice setup failed: {voice_error}")
+            else:
+                print("❌ Voice generation skipped - missing requirements")
+            
+            def synthesize(sentence):
+                audio_generator = elevenlabs_client.text_to_speech.convert(
+                    voice_id=os.getenv("JIM_ROHN_VOICE_ID"),
+                    text=sentence,
+                    model_id="eleven_monolingual_v1"
+                )
+                return b"".join(audio_generator)
+            
+            stream = self.openai_client.chat.completions.create(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": enhanced_prompt},
                     {"role": "user", "content": question}
                 ],
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                stream=True
             )
             
-            jim_response = response.choices[0].message.content
+            parts = []
+            pending = ""
+            tts_futures = []
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if elevenlabs_client:
+                    # Feed completed sentences to TTS as they arrive
+                    pending += delta
+                    cut = max(pending.rfind('. '), pending.rfind('? '), pending.rfind('! '))
+                    if cut != -1:
+                        sentence = self.clean_text_for_speech(pending[:cut + 1])
+                        if sentence:
+                            tts_futures.append(_TTS_POOL.submit(synthesize, sentence))
+                        pending = pending[cut + 1:]
             
-            # Generate voice if requested and API key is available
-            audio_data = None
-            print(f"🎤 Voice generation requested: {generate_voice}")
-            print(f"🔑 API Key available: {bool(os.getenv('ELEVENLABS_API_KEY'))}")
-            print(f"🗣️ Voice ID available: {bool(os.getenv('JIM_ROHN_VOICE_ID'))}")
+            jim_response = "".join(parts)
             
-            if generate_voice and os.getenv("ELEVENLABS_API_KEY") and os.getenv("JIM_ROHN_VOICE_ID"):
+            # Collect the synthesized sentences in order
+            audio_data = None
+            if elevenlabs_client:
                 try:
-                    from elevenlabs import ElevenLabs
-                    import re
-                    
-                    elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-                    
-                    # Clean text for speech synthesis
-                    clean_text = self.clean_text_for_speech(jim_response)
-                    print(f"📝 Cleaned text length: {len(clean_text)}")
-                    
-                    # Use the correct API method and convert generator to bytes
-                    audio_generator = elevenlabs_client.text_to_speech.convert(
-                        voice_id=os.getenv("JIM_ROHN_VOICE_ID"),
-                        text=clean_text,
-                        model_id="eleven_monolingual_v1"
-                    )
-                    audio_data = b"".join(audio_generator)
+                    tail = self.clean_text_for_speech(pending)
+                    if tail:
+                        tts_futures.append(_TTS_POOL.submit(synthesize, tail))
+                    audio_data = b"".join(f.result() for f in tts_futures)
                     print(f"✅ Generated voice response ({len(audio_data)} bytes)")
-                    
                 except Exception as voice_error:
                     print(f"⚠️ Voice generation failed: {voice_error}")
                     import traceback
                     traceback.print_exc()
                     audio_data = None
-            else:
-                print("❌ Voice generation skipped - missing requirements")
             
             # Store conversation in memory system
             conversation = {
@@ -272,16 +564,15 @@ class JimRohnCoach:
             }
             self.conversations.append(conversation)
             self.conversation_history.append(conversation)
+            self._context_cache.clear()  # stored contexts are now stale
             
-            # Analyze patterns and save memory
-            self.analyze_conversation_patterns(question, jim_response)
-            self.user_profile["total_conversations"] = len(self.conversation_history)
-            self.user_profile["last_conversation"] = conversation["timestamp"]
-            if not self.user_profile.get("first_conversation"):
-                self.user_profile["first_conversation"] = conversation["timestamp"]
-            
-            # Save memory to disk
-            self.save_memory()
+            # Analyze patterns and save memory in the background so the
+            # user's response isn't held behind a second GPT call
+            threading.Thread(
+                target=self._analyze_and_save,
+                args=(question, jim_response, conversation["timestamp"]),
+                daemon=True
+            ).start()
             
             return {
                 "success": True,
@@ -303,6 +594,19 @@ class JimRohnCoach:
 # Initialize coach
 coach = JimRohnCoach()
 
+# Recently generated audio, served by id from /audio/<id> so responses
+# carry a short URL instead of a base64 blob
+AUDIO_CACHE = OrderedDict()
+AUDIO_CACHE_MAX = 32
+
+def stash_audio(audio_data):
+    """Park audio bytes for pickup via /audio/<id>."""
+    audio_id = uuid.uuid4().hex
+    AUDIO_CACHE[audio_id] = audio_data
+    while len(AUDIO_CACHE) > AUDIO_CACHE_MAX:
+        AUDIO_CACHE.popitem(last=False)
+    return audio_id
+
 # HTML template
 HTML_CONTENT = '''<!DOCTYPE html>
 <html lang="en">
@@ -944,9 +1248,9 @@ HTML_CONTENT = '''<!DOCTYPE html>
             document.querySelector('.container').appendChild(enableButton);
         }
 
-        async function playAudio(audioData) {
+        async function playAudio(audioUrl) {
             try {
-                console.log('Playing audio, data length:', audioData.length);
+                console.log('Playing audio from:', audioUrl);
                 
                 // Ensure audio is unlocked first
                 if (!audioUnlocked) {
@@ -958,58 +1262,37 @@ HTML_CONTENT = '''<!DOCTYPE html>
                 // Show visualizer
                 showAudioVisualizer();
                 
-                // Convert base64 to binary string, then to Uint8Array
-                const binaryString = atob(audioData);
-                const bytes = new Uint8Array(binaryString.length);
-                for (let i = 0; i < binaryString.length; i++) {
-                    bytes[i] = binaryString.charCodeAt(i);
-                }
+                // Point the element straight at the streaming endpoint; the
+                // browser begins playback before the download finishes
+                const audio = new Audio(audioUrl);
+                audio.volume = 0.8;
                 
-                // Use MP3 format for best compatibility
-                try {
-                    const audioBlob = new Blob([bytes], { type: 'audio/mpeg' });
-                    const audioUrl = URL.createObjectURL(audioBlob);
-                    
-                    const audio = new Audio(audioUrl);
-                    audio.volume = 0.8;
-                    
-                    // Set up event handlers
-                    audio.onended = () => {
-                        URL.revokeObjectURL(audioUrl);
-                        hideAudioVisualizer();
-                    };
-                    
-                    audio.onerror = (e) => {
-                        console.warn('Audio playback failed:', e);
-                        URL.revokeObjectURL(audioUrl);
-                        hideAudioVisualizer();
-                    };
-                    
-                    // Play the audio
-                    audio.play()
-                        .then(() => {
-                            console.log('Audio playing successfully (MP3)');
-                        })
-                        .catch(e => {
-                            console.warn('Audio play failed:', e);
-                            if (e.name === 'NotAllowedError') {
-                                showAudioBlockedMessage();
-                            }
-                            hideAudioVisualizer();
-                        });
-                        
-                } catch (error) {
-                    console.error('Audio creation failed:', error);
+                // Set up event handlers
+                audio.onended = () => {
                     hideAudioVisualizer();
-                }
+                };
+                
+                audio.onerror = (e) => {
+                    console.warn('Audio playback failed:', e);
+                    hideAudioVisualizer();
+                };
+                
+                // Play the audio
+                audio.play()
+                    .then(() => {
+                        console.log('Audio playing successfully (MP3)');
+                    })
+                    .catch(e => {
+                        console.warn('Audio play failed:', e);
+                        if (e.name === 'NotAllowedError') {
+                            showAudioBlockedMessage();
+                        }
+                        hideAudioVisualizer();
+                    });
                 
             } catch (error) {
                 console.error('Audio processing failed:', error);
                 hideAudioVisualizer(); // Hide visualizer on error
-                // Only alert for unexpected errors, not browser compatibility
-                if (error.message.includes('atob') || error.message.includes('Blob')) {
-                    alert('Audio processing failed: ' + error.message);
-                }
             }
         }
 
@@ -1058,11 +1341,11 @@ HTML_CONTENT = '''<!DOCTYPE html>
                     const messageElement = addMessage('Jim Rohn', data.response, 'jim-message');
                     
                     // Play audio if available
-                    console.log('Response has_voice:', data.has_voice, 'audio length:', data.audio ? data.audio.length : 'no audio');
-                    if (data.has_voice && data.audio) {
+                    console.log('Response has_voice:', data.has_voice, 'audio url:', data.audio_url || 'no audio');
+                    if (data.has_voice && data.audio_url) {
                         try {
                             console.log('Attempting to play audio...');
-                            playAudio(data.audio);
+                            playAudio(data.audio_url);
                             // Add audio indicator to message
                             const audioIcon = document.createElement('span');
                             audioIcon.innerHTML = ' 🔊';
@@ -1257,40 +1540,82 @@ HTML_CONTENT = '''<!DOCTYPE html>
 </body>
 </html>'''
 
+# Compressed once at import; the page is static, so an ETag lets repeat
+# loads revalidate without re-downloading the body at all
+_HTML_BYTES = HTML_CONTENT.encode('utf-8')
+_HTML_GZIP = gzip.compress(_HTML_BYTES, compresslevel=9)
+_HTML_ETAG = f'"{hashlib.md5(_HTML_BYTES).hexdigest()}"'
+
 class JimRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection alive, so the page, audio and history
+    # requests from one browser reuse a single socket
+    protocol_version = "HTTP/1.1"
+    
     def log_message(self, format, *args):
         # Suppress default logging
         pass
     
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
+            if self.headers.get('If-None-Match') == _HTML_ETAG:
+                self.send_response(304)
+                self.send_header('ETag', _HTML_ETAG)
+                self.end_headers()
+                return
+            body = _HTML_GZIP if 'gzip' in self.headers.get('Accept-Encoding', '') else _HTML_BYTES
             self.send_response(200)
             self.send_header('Content-type', 'text/html; charset=utf-8')
             self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', _HTML_ETAG)
+            if body is _HTML_GZIP:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(HTML_CONTENT.encode('utf-8'))
+            self.wfile.write(body)
+        elif self.path.startswith('/audio/'):
+            audio_data = AUDIO_CACHE.get(self.path[len('/audio/'):])
+            if audio_data is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-type', 'audio/mpeg')
+            self.send_header('Content-Length', str(len(audio_data)))
+            self.end_headers()
+            # Write in chunks so playback can start before the full file
+            # has been sent
+            for i in range(0, len(audio_data), 16384):
+                self.wfile.write(audio_data[i:i + 16384])
         elif self.path == '/history':
             # Return conversation history as JSON
             try:
                 history_data = {
-                    "conversations": coach.conversation_history[-50:],  # Last 50 conversations
+                    # Last 50 conversations; islice avoids copying the deque
+                    "conversations": list(islice(
+                        coach.conversation_history,
+                        max(0, len(coach.conversation_history) - 50), None)),
                     "user_profile": coach.user_profile,
                     "total_conversations": len(coach.conversation_history)
                 }
+                body = _json_dumps(history_data).encode('utf-8')
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(json.dumps(history_data).encode('utf-8'))
+                self.wfile.write(body)
             except Exception as e:
+                body = json.dumps({"error": str(e)}).encode('utf-8')
                 self.send_response(500)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                error_response = json.dumps({"error": str(e)})
-                self.wfile.write(error_response.encode('utf-8'))
+                self.wfile.write(body)
         else:
             self.send_response(404)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', '15')
             self.end_headers()
             self.wfile.write(b'404 - Not Found')
     
@@ -1304,37 +1629,43 @@ class JimRequestHandler(BaseHTTPRequestHandler):
                 voice_enabled = params.get('voice', ['false'])[0].lower() == 'true'
                 
                 if question:
-                    result = coach.ask_jim(question, generate_voice=voice_enabled)
+                    result = _ASK_POOL.submit(
+                        coach.ask_jim, question, generate_voice=voice_enabled).result()
                     
-                    # Convert audio data to base64 for JSON transmission
-                    if result.get('audio'):
-                        import base64
-                        result['audio'] = base64.b64encode(result['audio']).decode('utf-8')
+                    # Hand back a URL instead of inflating the audio ~33%
+                    # as base64 inside the JSON body
+                    audio_data = result.pop('audio', None)
+                    if audio_data:
+                        result['audio_url'] = f"/audio/{stash_audio(audio_data)}"
                     
-                    response_text = json.dumps(result)
+                    response_text = _json_dumps(result)
                 else:
-                    response_text = json.dumps({
+                    response_text = _json_dumps({
                         "success": False,
                         "response": "Please ask me something!"
                     })
                 
+                body = response_text.encode('utf-8')
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(response_text.encode('utf-8'))
+                self.wfile.write(body)
                 
             except Exception as e:
+                body = json.dumps({
+                    "success": False,
+                    "response": f"Server error: {str(e)}"
+                }).encode('utf-8')
                 self.send_response(500)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                error_response = json.dumps({
-                    "success": False,
-                    "response": f"Server error: {str(e)}"
-                })
-                self.wfile.write(error_response.encode('utf-8'))
+                self.wfile.write(body)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
 def find_available_port(start_port=9999):
@@ -1382,9 +1713,10 @@ def main():
         print(f"❌ {e}")
         return
     
-    # Create and start server
+    # Create and start server; the threading server keeps one slow
+    # OpenAI/ElevenLabs round-trip from blocking every other request
     server_address = ('127.0.0.1', port)
-    httpd = HTTPServer(server_address, JimRequestHandler)
+    httpd = ThreadingHTTPServer(server_address, JimRequestHandler)
     
     url = f"http://127.0.0.1:{port}"
     print(f"🌐 Jim Rohn AI Coach starting at: {url}")
@@ -1393,8 +1725,9 @@ def main():
     print("=" * 50)
     print("Press Ctrl+C to stop the server")
     
-    # Start browser opener in background
-    browser_thread = threading.Thread(target=open_browser_delayed, args=(url, 2))
+    # Start browser opener in background; the listening socket already
+    # exists once the server is constructed, so no long blind delay
+    browser_thread = threading.Thread(target=open_browser_delayed, args=(url, 0.2))
     browser_thread.daemon = True
     browser_thread.start()
     
@@ -5,12 +5,15 @@ Supports multiple users with individual profiles and shared knowledge base
 """
 
 import os
+import gzip
 import json
+import uuid
 import hashlib
 import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from flask import Flask, request, jsonify, render_template_string, session, redirect, url_for, send_file
+from flask import Flask, request, jsonify, render_template_string, session, redirect, url_for, send_file, Response
 from openai import OpenAI
 from dotenv import load_dotenv
 import re
@@ -387,13 +390,41 @@ app = Flask(__name__)
 app.secret_key = os.getenv("SECRET_KEY", "change-this-secret-key-in-production")
 coach = MultiUserJimCoach()
 
+def minify_template(html: str) -> str:
+    """Minify an HTML template once at import time (no-op if htmlmin isn't installed)."""
+    try:
+        import htmlmin
+        return htmlmin.minify(html, remove_comments=True, remove_empty_space=True)
+    except ImportError:
+        return html
+
+@app.after_request
+def compress_response(response):
+    """Gzip large text responses when the client supports it."""
+    if (response.status_code == 200
+            and not response.direct_passthrough
+            and response.content_length and response.content_length > 1024
+            and 'gzip' in request.headers.get('Accept-Encoding', '')
+            and 'Content-Encoding' not in response.headers):
+        response.set_data(gzip.compress(response.get_data(), 6))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def serve_html(html, html_gz):
+    """Serve a prerendered page, precompressed when the client accepts gzip."""
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return Response(html_gz, mimetype='text/html',
+                        headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+    return Response(html, mimetype='text/html')
+
 @app.route('/')
 def home():
     """Home page - login or register."""
     if 'user_id' in session:
         return redirect(url_for('chat'))
     
-    return render_template_string(LOGIN_TEMPLATE)
+    return serve_html(LOGIN_TEMPLATE, LOGIN_TEMPLATE_GZ)
 
 @app.route('/register', methods=['POST'])
 def register():
@@ -434,7 +465,20 @@ def chat():
         return redirect(url_for('home'))
     
     print(f"User {session.get('username')} accessing chat")
-    return render_template_string(CHAT_TEMPLATE)
+    return serve_html(CHAT_TEMPLATE, CHAT_TEMPLATE_GZ)
+
+# Short-lived in-memory store for generated MP3s, served by /api/audio/<id>
+# so /api/ask can return a URL instead of base64-inflating the audio into JSON
+AUDIO_CACHE = OrderedDict()
+AUDIO_CACHE_MAX = 64
+
+def stash_audio(audio_bytes) -> str:
+    """Store audio bytes under a one-time id, evicting the oldest entries."""
+    audio_id = uuid.uuid4().hex
+    AUDIO_CACHE[audio_id] = audio_bytes
+    while len(AUDIO_CACHE) > AUDIO_CACHE_MAX:
+        AUDIO_CACHE.popitem(last=False)
+    return audio_id
 
 @app.route('/api/ask', methods=['POST'])
 def api_ask():
@@ -448,8 +492,61 @@ def api_ask():
         data['question'],
         data.get('generate_voice', False)
     )
+    audio = result.pop('audio', None)
+    if audio:
+        result['audio_url'] = f"/api/audio/{stash_audio(audio)}"
     return jsonify(result)
 
+@app.route('/api/audio/<audio_id>')
+def api_audio(audio_id):
+    """Serve a recently generated voice reply as raw MP3 bytes."""
+    if 'user_id' not in session:
+        return jsonify({"success": False, "error": "Not authenticated"})
+    
+    audio = AUDIO_CACHE.get(audio_id)
+    if audio is None:
+        return ('', 404)
+    
+    def stream_chunks(data, chunk_size=16384):
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+    
+    return Response(stream_chunks(audio), mimetype='audio/mpeg',
+                    headers={'Cache-Control': 'private, max-age=3600'})
+
+# Optional WebSocket channel: when flask-sock is installed, /ws/ask answers with
+# a JSON text frame followed by raw binary MP3 frames, avoiding the 33% base64
+# inflation and full-payload buffering of the JSON API. The JSON endpoint stays
+# as the fallback for clients (and deployments) without WebSocket support.
+try:
+    from flask_sock import Sock
+    sock = Sock(app)
+
+    @sock.route('/ws/ask')
+    def ws_ask(ws):
+        if 'user_id' not in session:
+            ws.close()
+            return
+        while True:
+            message = ws.receive()
+            if message is None:
+                break
+            data = json.loads(message)
+            result = coach.ask_jim(
+                session['user_id'],
+                data['question'],
+                data.get('generate_voice', False)
+            )
+            audio = result.pop('audio', None)
+            result['has_audio'] = audio is not None
+            ws.send(json.dumps(result))
+            if audio:
+                for i in range(0, len(audio), 16384):
+                    ws.send(audio[i:i + 16384])
+                ws.send(json.dumps({"audio_done": True}))
+except ImportError:
+    sock = None
+
 @app.route('/api/history')
 def api_history():
     """Get user's conversation history."""
@@ -462,12 +559,13 @@ def api_history():
 @app.route('/admin')
 def admin_dashboard():
     """Admin dashboard."""
-    return render_template_string(ADMIN_TEMPLATE)
+    return serve_html(ADMIN_TEMPLATE, ADMIN_TEMPLATE_GZ)
 
-@app.route('/admin/stats')
+@app.route('/admin/stats', methods=['POST'])
 def admin_stats():
     """Get admin statistics."""
-    password = request.args.get('password')
+    password = request.get_json(silent=True, force=True) or {}
+    password = password.get('password')
     if password != coach.admin_password:
         return jsonify({"error": "Invalid admin password"})
     
@@ -1060,6 +1158,9 @@ CHAT_TEMPLATE = """
             font-size: 13px;
         }
 
+        .status-ok { color: #28a745; }
+        .status-err { color: #dc3545; }
+
         .status-indicator {
             display: inline-block;
             width: 8px;
@@ -1179,6 +1280,9 @@ CHAT_TEMPLATE = """
             max-height: 60px;
             overflow: hidden;
             position: relative;
+            /* Fade via mask instead of a gradient overlay - cheaper to paint on long lists */
+            -webkit-mask-image: linear-gradient(to right, black 60%, transparent);
+            mask-image: linear-gradient(to right, black 60%, transparent);
         }
 
         .history-response.truncated::after {
@@ -1186,7 +1290,7 @@ CHAT_TEMPLATE = """
             position: absolute;
             bottom: 0;
             right: 0;
-            background: linear-gradient(to right, transparent, #21262d 50%);
+            background: #21262d;
             padding-left: 20px;
             color: #1f6feb;
             font-style: italic;
@@ -1401,11 +1505,28 @@ CHAT_TEMPLATE = """
         let voiceEnabled = true;
         let audioUnlocked = false;
 
+        // These nodes are static; look them up once instead of per call
+        const chatContainerEl = document.getElementById('chatContainer');
+        const questionInputEl = document.getElementById('questionInput');
+        const askButtonEl = document.getElementById('askButton');
+        const statusTextEl = document.getElementById('statusText');
+
+        // Coalesce /api/history fetches: the sidebar and the history modal share
+        // one request (and one JSON parse) per 5 second window
+        const inflightHistory = new Map();
+        function getHistory() {
+            if (!inflightHistory.has('history')) {
+                inflightHistory.set('history', fetch('/api/history')
+                    .then(response => response.json())
+                    .finally(() => setTimeout(() => inflightHistory.delete('history'), 5000)));
+            }
+            return inflightHistory.get('history');
+        }
+
         // Load conversation count and recent conversations
         async function loadConversationCount() {
             try {
-                const response = await fetch('/api/history');
-                const data = await response.json();
+                const data = await getHistory();
                 if (data.success) {
                     conversationCount = data.conversations.length || 0;
                     document.getElementById('conversationCount').textContent = conversationCount;
@@ -1452,6 +1573,19 @@ CHAT_TEMPLATE = """
             container.innerHTML = html;
         }
 
+        // Debounced sidebar refresh: runs at most once per burst, during idle
+        // time, so it never competes with audio starting up after an answer
+        const scheduleRefresh = (() => {
+            let timer;
+            const run = () => ('requestIdleCallback' in window)
+                ? requestIdleCallback(loadConversationCount)
+                : loadConversationCount();
+            return () => {
+                clearTimeout(timer);
+                timer = setTimeout(run, 2000);
+            };
+        })();
+
         // Helper function to get time ago
         function getTimeAgo(date) {
             const now = new Date();
@@ -1473,6 +1607,10 @@ CHAT_TEMPLATE = """
             // TODO: Could add logic to highlight/scroll to specific conversation
         }
 
+        // Cache static DOM nodes once so the speech handlers don't re-query per event
+        const micButtonEl = document.getElementById('micButton');
+        const recordingStatusEl = document.getElementById('recordingStatus');
+
         // Initialize speech recognition
         if ('webkitSpeechRecognition' in window || 'SpeechRecognition' in window) {
             const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
@@ -1480,22 +1618,22 @@ CHAT_TEMPLATE = """
             recognition.continuous = false;
             recognition.interimResults = false;
             recognition.lang = 'en-US';
-            
+
             recognition.onstart = function() {
                 isRecording = true;
-                document.getElementById('micButton').classList.add('recording');
-                document.getElementById('recordingStatus').style.display = 'block';
+                micButtonEl.classList.add('recording');
+                recordingStatusEl.style.display = 'block';
             };
-            
+
             recognition.onend = function() {
                 isRecording = false;
-                document.getElementById('micButton').classList.remove('recording');
-                document.getElementById('recordingStatus').style.display = 'none';
+                micButtonEl.classList.remove('recording');
+                recordingStatusEl.style.display = 'none';
             };
             
             recognition.onresult = function(event) {
                 const transcript = event.results[0][0].transcript;
-                document.getElementById('questionInput').value = transcript;
+                questionInputEl.value = transcript;
             };
             
             recognition.onerror = function(event) {
@@ -1566,8 +1704,7 @@ CHAT_TEMPLATE = """
             modal.style.display = 'block';
             content.innerHTML = '<p>Loading history...</p>';
             
-            fetch('/api/history')
-                .then(response => response.json())
+            getHistory()
                 .then(data => {
                     let html = '';
                     
@@ -1598,9 +1735,11 @@ CHAT_TEMPLATE = """
                             html += `</div>`;
                             html += `<div class="history-question">Q: ${conversation.question}</div>`;
                             html += `<div class="history-response ${isLong ? 'truncated' : ''}" id="response-${index}">`;
-                            html += `A: <span id="response-text-${index}">${truncatedResponse}</span>`;
+                            html += `A: <span class="resp-short" id="response-text-${index}">${truncatedResponse}</span>`;
+                            if (isLong) {
+                                html += `<span class="resp-full" hidden>${conversation.response}</span>`;
+                            }
                             html += `</div>`;
-                            html += `<div style="display: none;" id="full-response-${index}">${conversation.response}</div>`;
                             html += '</div>';
                         });
                     } else {
@@ -1608,6 +1747,18 @@ CHAT_TEMPLATE = """
                     }
                     
                     content.innerHTML = html;
+
+                    // Cache the per-row element references once at render time so
+                    // toggleConversation doesn't do three getElementById calls per click
+                    conversationsData.forEach((conversation, index) => {
+                        const response = document.getElementById(`response-${index}`);
+                        conversation.els = {
+                            response,
+                            shortText: response.querySelector('.resp-short'),
+                            fullText: response.querySelector('.resp-full'),
+                            indicator: document.getElementById(`indicator-${index}`)
+                        };
+                    });
                 })
                 .catch(error => {
                     content.innerHTML = '<p>Error loading history: ' + error.message + '</p>';
@@ -1621,29 +1772,21 @@ CHAT_TEMPLATE = """
         // Toggle conversation expansion
         function toggleConversation(index) {
             const conversation = conversationsData[index];
-            const responseElement = document.getElementById(`response-${index}`);
-            const responseTextElement = document.getElementById(`response-text-${index}`);
-            const indicator = document.getElementById(`indicator-${index}`);
+            const { response: responseElement, shortText, fullText, indicator } = conversation.els;
+            if (!fullText) {
+                return;  // short response, nothing to expand
+            }
             const conversationDiv = responseElement.closest('.history-conversation');
-            
-            const isExpanded = conversationDiv.classList.contains('expanded');
-            
-            if (isExpanded) {
-                // Collapse
-                conversationDiv.classList.remove('expanded');
-                responseElement.classList.add('truncated');
-                responseTextElement.textContent = conversation.response.substring(0, 200);
-                if (indicator) {
-                    indicator.textContent = '▼ Click to expand';
-                }
-            } else {
-                // Expand
-                conversationDiv.classList.add('expanded');
-                responseElement.classList.remove('truncated');
-                responseTextElement.textContent = conversation.response;
-                if (indicator) {
-                    indicator.textContent = '▲ Click to collapse';
-                }
+            const expanded = !conversationDiv.classList.contains('expanded');
+
+            // Flip hidden on the two sibling spans instead of rewriting a
+            // multi-KB textContent on every toggle
+            conversationDiv.classList.toggle('expanded', expanded);
+            responseElement.classList.toggle('truncated', !expanded);
+            shortText.hidden = expanded;
+            fullText.hidden = !expanded;
+            if (indicator) {
+                indicator.textContent = expanded ? '▲ Click to collapse' : '▼ Click to expand';
             }
         }
 
@@ -1660,11 +1803,43 @@ CHAT_TEMPLATE = """
         let pendingAudio = null;
         let conversationsData = [];
 
+        // Pool of pre-unlocked Audio elements, reused across playbacks so each
+        // response doesn't allocate a fresh HTMLMediaElement
+        const audioPool = [];
+
+        // LRU cache of decoded AudioBuffers so identical replies skip the
+        // base64 and MP3 decode entirely on replay
+        const audioCache = new Map();
+        const AUDIO_CACHE_MAX = 16;
+
+        async function getDecodedAudio(audioUrl) {
+            let audioBuffer = audioCache.get(audioUrl);
+            if (audioBuffer) {
+                audioCache.delete(audioUrl);
+                audioCache.set(audioUrl, audioBuffer);  // refresh LRU position
+                return audioBuffer;
+            }
+            const bytes = await (await fetch(audioUrl)).arrayBuffer();
+            audioBuffer = await globalAudioContext.decodeAudioData(bytes);
+            audioCache.set(audioUrl, audioBuffer);
+            if (audioCache.size > AUDIO_CACHE_MAX) {
+                audioCache.delete(audioCache.keys().next().value);
+            }
+            return audioBuffer;
+        }
+
+        // Single deferral path for a locked AudioContext: remember the reply
+        // and surface the unlock button, whether we never unlocked or iOS
+        // re-locked us after tab-backgrounding
+        function deferToUnlock(audioUrl) {
+            pendingAudio = audioUrl;
+            createAudioUnlockButton();
+        }
+
         function createAudioUnlockButton() {
-            // Remove any existing button
-            const existingButton = document.getElementById('audioUnlockButton');
-            if (existingButton) {
-                existingButton.remove();
+            // Keep the existing button rather than tearing down and rebuilding
+            if (document.getElementById('audioUnlockButton')) {
+                return;
             }
 
             const button = document.createElement('button');
@@ -1704,6 +1879,15 @@ CHAT_TEMPLATE = """
                     
                     audioUnlocked = true;
                     console.log('Audio unlocked successfully');
+
+                    // Pre-unlock a few Audio elements while we still have the user
+                    // gesture; later playbacks just reassign .src on a pooled element
+                    for (let i = 0; i < 3; i++) {
+                        const pooled = new Audio();
+                        pooled.play().catch(() => {});
+                        pooled.pause();
+                        audioPool.push(pooled);
+                    }
                     
                     // Remove the button
                     button.remove();
@@ -1711,14 +1895,13 @@ CHAT_TEMPLATE = """
                     // Update voice button status
                     updateVoiceButtonStatus();
                     
-                    // Update status
-                    const statusText = document.getElementById('statusText');
-                    statusText.textContent = 'Audio Enabled! Ask Jim again to hear his voice';
-                    statusText.style.color = '#28a745';
+                    // Update status (class swap = one style invalidation)
+                    statusTextEl.textContent = 'Audio Enabled! Ask Jim again to hear his voice';
+                    statusTextEl.className = 'status-ok';
                     
                     setTimeout(() => {
-                        statusText.textContent = 'Connected & Ready';
-                        statusText.style.color = '';
+                        statusTextEl.textContent = 'Connected & Ready';
+                        statusTextEl.className = '';
                     }, 3000);
                     
                     // If there's pending audio, play it now
@@ -1737,39 +1920,100 @@ CHAT_TEMPLATE = """
             document.body.appendChild(button);
         }
 
-        async function playAudioDirect(audioData) {
+        function playDecoded(audioBuffer) {
+            const source = globalAudioContext.createBufferSource();
+            source.buffer = audioBuffer;
+            source.connect(globalAudioContext.destination);
+            source.onended = () => {
+                hideAudioVisualizer();
+                console.log('Audio playback completed');
+            };
+            source.start(0);
+        }
+
+        // Stream the MP3 through MediaSource so playback starts on the first
+        // chunks instead of waiting for the whole response to download
+        async function streamAudio(audioUrl) {
+            const response = await fetch(audioUrl);
+            const mediaSource = new MediaSource();
+            const audio = audioPool.pop() || new Audio();
+            const objectUrl = URL.createObjectURL(mediaSource);
+            audio.src = objectUrl;
+            audio.volume = 0.8;
+
+            audio.onended = () => {
+                URL.revokeObjectURL(objectUrl);
+                audioPool.push(audio);
+                hideAudioVisualizer();
+                console.log('Audio playback completed');
+            };
+
+            audio.onerror = (e) => {
+                console.error('Audio playback error:', e);
+                URL.revokeObjectURL(objectUrl);
+                audioPool.push(audio);
+                hideAudioVisualizer();
+            };
+
+            mediaSource.addEventListener('sourceopen', async () => {
+                const sourceBuffer = mediaSource.addSourceBuffer('audio/mpeg');
+                const reader = response.body.getReader();
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (done) {
+                        mediaSource.endOfStream();
+                        break;
+                    }
+                    await new Promise(resolve => {
+                        sourceBuffer.onupdateend = resolve;
+                        sourceBuffer.appendBuffer(value);
+                    });
+                }
+            }, { once: true });
+
+            await audio.play();
+        }
+
+        async function playAudioDirect(audioUrl) {
             try {
-                console.log('Playing audio directly, data length:', audioData.length);
+                console.log('Playing audio from:', audioUrl);
                 
                 showAudioVisualizer();
                 
-                // Convert base64 to binary string, then to Uint8Array
-                const binaryString = atob(audioData);
-                const bytes = new Uint8Array(binaryString.length);
-                for (let i = 0; i < binaryString.length; i++) {
-                    bytes[i] = binaryString.charCodeAt(i);
+                // Already-decoded replies play instantly through WebAudio
+                if (globalAudioContext && audioCache.has(audioUrl)) {
+                    playDecoded(await getDecodedAudio(audioUrl));
+                    return;
                 }
                 
-                // Create audio with MP3 format
-                const audioBlob = new Blob([bytes], { type: 'audio/mpeg' });
-                const audioUrl = URL.createObjectURL(audioBlob);
+                // First play: stream incrementally when the browser supports it
+                if ('MediaSource' in window && MediaSource.isTypeSupported('audio/mpeg')) {
+                    await streamAudio(audioUrl);
+                    return;
+                }
                 
-                const audio = new Audio(audioUrl);
+                if (globalAudioContext) {
+                    playDecoded(await getDecodedAudio(audioUrl));
+                    return;
+                }
+
+                // Last resort: point a pooled Audio element at the endpoint
+                const audio = audioPool.pop() || new Audio();
+                audio.src = audioUrl;
                 audio.volume = 0.8;
-                
+
                 audio.onended = () => {
-                    URL.revokeObjectURL(audioUrl);
+                    audioPool.push(audio);
                     hideAudioVisualizer();
                     console.log('Audio playback completed');
                 };
-                
+
                 audio.onerror = (e) => {
                     console.error('Audio playback error:', e);
-                    URL.revokeObjectURL(audioUrl);
+                    audioPool.push(audio);
                     hideAudioVisualizer();
                 };
                 
-                // Play the audio
                 await audio.play();
                 console.log('Audio playing successfully');
                         
@@ -1780,45 +2024,112 @@ CHAT_TEMPLATE = """
             }
         }
 
-        async function playAudio(audioData) {
+        async function playAudio(audioUrl) {
+            // Check if audio is unlocked
+            if (!audioUnlocked || !globalAudioContext) {
+                console.log('Audio not unlocked, storing for later and showing unlock button');
+                deferToUnlock(audioUrl);
+                return;
+            }
+            
             try {
-                // Check if audio is unlocked
-                if (!audioUnlocked || !globalAudioContext) {
-                    console.log('Audio not unlocked, storing for later and showing unlock button');
-                    pendingAudio = audioData;
-                    createAudioUnlockButton();
-                    return;
-                }
-                
                 // Audio is unlocked, play directly
-                await playAudioDirect(audioData);
+                await playAudioDirect(audioUrl);
                         
             } catch (error) {
+                // playAudioDirect hid the visualizer before rethrowing
                 console.error('Audio processing failed:', error);
-                hideAudioVisualizer();
                 
                 if (error.name === 'NotAllowedError') {
                     console.log('Audio blocked, showing unlock button');
-                    pendingAudio = audioData;
-                    createAudioUnlockButton();
+                    deferToUnlock(audioUrl);
                 } else {
                     // Other error, show message
-                    const statusText = document.getElementById('statusText');
-                    statusText.textContent = 'Audio error - voice disabled for this session';
-                    statusText.style.color = '#dc3545';
+                    statusTextEl.textContent = 'Audio error - voice disabled for this session';
+                    statusTextEl.className = 'status-err';
                     setTimeout(() => {
-                        statusText.textContent = 'Connected & Ready';
-                        statusText.style.color = '';
+                        statusTextEl.textContent = 'Connected & Ready';
+                        statusTextEl.className = '';
                     }, 3000);
                 }
             }
         }
 
+        // Persistent WebSocket to /ws/ask (if the server exposes it): one JSON
+        // text frame with the reply, then raw MP3 frames with no base64 inflation
+        let askSocketReady = null;
+
+        function getAskSocket() {
+            if (!askSocketReady) {
+                askSocketReady = new Promise((resolve) => {
+                    const scheme = location.protocol === 'https:' ? 'wss://' : 'ws://';
+                    const ws = new WebSocket(scheme + location.host + '/ws/ask');
+                    ws.binaryType = 'arraybuffer';
+                    ws.onopen = () => resolve(ws);
+                    ws.onerror = () => resolve(null);
+                    ws.onclose = () => { askSocketReady = null; };
+                });
+            }
+            return askSocketReady;
+        }
+
+        function askJimViaSocket(ws, question) {
+            return new Promise((resolve, reject) => {
+                let result = null;
+                const audioChunks = [];
+                ws.onmessage = (event) => {
+                    if (typeof event.data === 'string') {
+                        const frame = JSON.parse(event.data);
+                        if (frame.audio_done) {
+                            result.audioChunks = audioChunks;
+                            resolve(result);
+                        } else {
+                            result = frame;
+                            if (!result.success || !result.has_audio) {
+                                resolve(result);
+                            }
+                        }
+                    } else {
+                        audioChunks.push(event.data);
+                    }
+                };
+                ws.onerror = reject;
+                ws.send(JSON.stringify({ question: question, generate_voice: voiceEnabled }));
+            });
+        }
+
+        async function playAudioChunks(chunks) {
+            try {
+                showAudioVisualizer();
+                const audio = audioPool.pop() || new Audio();
+                const url = URL.createObjectURL(new Blob(chunks, { type: 'audio/mpeg' }));
+                audio.src = url;
+                audio.volume = 0.8;
+                audio.onended = () => {
+                    URL.revokeObjectURL(url);
+                    audioPool.push(audio);
+                    hideAudioVisualizer();
+                };
+                audio.onerror = (e) => {
+                    console.error('Streamed audio playback error:', e);
+                    URL.revokeObjectURL(url);
+                    audioPool.push(audio);
+                    hideAudioVisualizer();
+                };
+                await audio.play();
+            } catch (error) {
+                console.error('Streamed audio playback failed:', error);
+                hideAudioVisualizer();
+            }
+        }
+
+        // AbortController for the most recent /api/ask fetch, so a rapid
+        // follow-up question cancels the obsolete request and its decode work
+        let askInflight = null;
+
         async function askJim() {
-            const question = document.getElementById('questionInput').value.trim();
-            const askButton = document.getElementById('askButton');
-            const chatContainer = document.getElementById('chatContainer');
-            const statusText = document.getElementById('statusText');
+            const question = questionInputEl.value.trim();
+            let controller = null;
 
             if (!question) {
                 alert('Please ask Jim a question.');
@@ -1829,59 +2140,90 @@ CHAT_TEMPLATE = """
             addMessage('You', question, 'user-message');
             
             // Clear input and disable button
-            document.getElementById('questionInput').value = '';
-            askButton.disabled = true;
-            askButton.innerHTML = '<span class="loading">Jim is thinking...</span>';
-            statusText.textContent = 'Jim is pondering your question';
+            questionInputEl.value = '';
+            askButtonEl.disabled = true;
+            askButtonEl.innerHTML = '<span class="loading">Jim is thinking...</span>';
+            statusTextEl.textContent = 'Jim is pondering your question';
 
             // Add loading message
             const loadingMessage = addMessage('Jim Rohn', 'Let me think about that...', 'jim-message');
 
             try {
-                const response = await fetch('/api/ask', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ 
-                        question: question, 
-                        generate_voice: voiceEnabled 
-                    })
-                });
-
-                const data = await response.json();
+                // Prefer the WebSocket channel; wait for the unlock gesture before
+                // sending voice questions over it, since streamed audio plays directly
+                const ws = (voiceEnabled && !audioUnlocked) ? null : await getAskSocket();
+                let data;
+                if (ws) {
+                    data = await askJimViaSocket(ws, question);
+                } else {
+                    if (askInflight) {
+                        askInflight.abort();
+                    }
+                    controller = askInflight = new AbortController();
+                    const response = await fetch('/api/ask', {
+                        method: 'POST',
+                        signal: controller.signal,
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({
+                            question: question,
+                            generate_voice: voiceEnabled
+                        })
+                    });
+                    data = await response.json();
+                }
 
                 // Remove loading message
-                chatContainer.removeChild(loadingMessage);
+                chatContainerEl.removeChild(loadingMessage);
 
                 if (data.success) {
+                    // Kick off the audio decode before the DOM work so the
+                    // buffer is ready by the time the message is rendered
+                    const audioPromise = (data.audio_url && voiceEnabled && audioUnlocked && globalAudioContext)
+                        ? getDecodedAudio(data.audio_url).catch(() => null)
+                        : null;
+                    
                     // Add Jim's response
                     const messageElement = addMessage('Jim Rohn', data.response, 'jim-message');
                     
                     // Play audio if available
-                    if (data.audio && voiceEnabled) {
+                    if (data.audioChunks && data.audioChunks.length && voiceEnabled) {
+                        playAudioChunks(data.audioChunks);
+                        const audioIcon = document.createElement('span');
+                        audioIcon.innerHTML = ' 🔊';
+                        audioIcon.style.color = '#28a745';
+                        audioIcon.title = 'Audio response available';
+                        messageElement._headerEl.appendChild(audioIcon);
+                    } else if (data.audio_url && voiceEnabled) {
                         try {
-                            await playAudio(data.audio);
+                            const audioBuffer = audioPromise && await audioPromise;
+                            if (audioBuffer) {
+                                showAudioVisualizer();
+                                playDecoded(audioBuffer);
+                            } else {
+                                await playAudio(data.audio_url);
+                            }
                             // Add audio indicator to message
                             const audioIcon = document.createElement('span');
                             audioIcon.innerHTML = ' 🔊';
                             audioIcon.style.color = '#28a745';
                             audioIcon.title = 'Audio response available';
-                            messageElement.querySelector('.message-header').appendChild(audioIcon);
+                            messageElement._headerEl.appendChild(audioIcon);
                         } catch (audioError) {
                             console.error('Audio playback error:', audioError);
                         }
                     }
                     
                     // Update conversation count and refresh sidebar
-                    statusText.textContent = 'Connected & Ready';
+                    statusTextEl.textContent = 'Connected & Ready';
                     
-                    // Refresh recent conversations in sidebar
-                    loadConversationCount();
+                    // Refresh recent conversations in sidebar once things settle
+                    scheduleRefresh();
                 } else {
                     // Add error message
                     addMessage('Jim Rohn', data.response || data.error || 'I encountered an error', 'jim-message');
-                    statusText.textContent = 'Technical difficulty - please try again';
+                    statusTextEl.textContent = 'Technical difficulty - please try again';
                 }
 
             } catch (error) {
@@ -1889,44 +2231,54 @@ CHAT_TEMPLATE = """
                 
                 // Remove loading message if it exists
                 if (loadingMessage && loadingMessage.parentNode) {
-                    chatContainer.removeChild(loadingMessage);
+                    chatContainerEl.removeChild(loadingMessage);
+                }
+                
+                if (error.name === 'AbortError') {
+                    return;  // superseded by a newer question
                 }
                 
                 // Add error message
                 addMessage('Jim Rohn', 'I apologize, but I\\'m having some technical difficulties right now. Please try again in a moment.', 'jim-message');
-                statusText.textContent = 'Connection error - please try again';
+                statusTextEl.textContent = 'Connection error - please try again';
             } finally {
-                // Re-enable button
-                askButton.disabled = false;
-                askButton.innerHTML = '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="22" y1="2" x2="11" y2="13"></line><polygon points="22,2 15,22 11,13 2,9 22,2"></polygon></svg> Send';
+                // Re-enable button (unless a newer request took over)
+                if (!controller || askInflight === controller) {
+                    askButtonEl.disabled = false;
+                    askButtonEl.innerHTML = '<svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="22" y1="2" x2="11" y2="13"></line><polygon points="22,2 15,22 11,13 2,9 22,2"></polygon></svg> Send';
+                }
             }
         }
 
         function addMessage(sender, content, className) {
-            const chatContainer = document.getElementById('chatContainer');
             const message = document.createElement('div');
             message.className = `message ${className}`;
-            
+
             const header = document.createElement('div');
             header.className = 'message-header';
             header.textContent = sender + ':';
-            
+
             const messageContent = document.createElement('div');
             messageContent.className = 'message-content';
             messageContent.textContent = content;
-            
-            message.appendChild(header);
-            message.appendChild(messageContent);
-            chatContainer.appendChild(message);
-            
-            // Scroll to bottom
-            chatContainer.scrollTop = chatContainer.scrollHeight;
-            
+
+            // Assemble off-document in a fragment so the live tree sees one append
+            const frag = document.createDocumentFragment();
+            frag.appendChild(header);
+            frag.appendChild(messageContent);
+            message.appendChild(frag);
+            message._headerEl = header;  // saved so callers skip a querySelector
+            chatContainerEl.appendChild(message);
+
+            // Scroll to bottom; scrollIntoView avoids the forced reflow
+            // of reading scrollHeight before writing scrollTop
+            message.scrollIntoView({block: 'end', behavior: 'auto'});
+
             return message;
         }
 
         // Allow Enter to send message
-        document.getElementById('questionInput').addEventListener('keydown', function(e) {
+        questionInputEl.addEventListener('keydown', function(e) {
             if (e.key === 'Enter' && !e.shiftKey) {
                 e.preventDefault();
                 askJim();
@@ -1934,7 +2286,7 @@ CHAT_TEMPLATE = """
         });
 
         // Auto-focus and load count
-        document.getElementById('questionInput').focus();
+        questionInputEl.focus();
         loadConversationCount();
     </script>
 </body>
@@ -1972,16 +2324,31 @@ ADMIN_TEMPLATE = """
         </div>
         
         <script>
+            let statsCache = null, statsAt = 0;
+            
             async function loadStats() {
                 const password = document.getElementById('adminPassword').value;
-                const response = await fetch(`/admin/stats?password=${password}`);
-                const result = await response.json();
+                
+                // Reuse a recent result instead of re-querying on every click
+                let result = (statsCache && Date.now() - statsAt < 10000) ? statsCache : null;
+                if (!result) {
+                    // POST keeps the password out of URLs and server logs
+                    const response = await fetch('/admin/stats', {
+                        method: 'POST',
+                        headers: {'Content-Type': 'application/json'},
+                        body: JSON.stringify({password})
+                    });
+                    result = await response.json();
+                }
                 
                 if (result.error) {
                     alert(result.error);
                     return;
                 }
                 
+                statsCache = result;
+                statsAt = Date.now();
+                
                 document.getElementById('stats').innerHTML = `
                     <div class="stat">
                         <h4>${result.total_users}</h4>
@@ -2028,6 +2395,17 @@ ADMIN_TEMPLATE = """
     </html>
     """
 
+# Minify the big inline templates once so the per-request cost is zero
+LOGIN_TEMPLATE = minify_template(LOGIN_TEMPLATE)
+CHAT_TEMPLATE = minify_template(CHAT_TEMPLATE)
+ADMIN_TEMPLATE = minify_template(ADMIN_TEMPLATE)
+
+# Compress each page once at import so requests ship a prebuilt buffer
+# instead of re-gzipping the same HTML every time
+LOGIN_TEMPLATE_GZ = gzip.compress(LOGIN_TEMPLATE.encode(), 9)
+CHAT_TEMPLATE_GZ = gzip.compress(CHAT_TEMPLATE.encode(), 9)
+ADMIN_TEMPLATE_GZ = gzip.compress(ADMIN_TEMPLATE.encode(), 9)
+
 # Production configuration
 def create_app():
     """Create and configure the Flask app for production."""
@@ -2040,4 +2418,10 @@ if __name__ == '__main__':
     print("🛑 To stop: Press Ctrl+C")
     
     port = int(os.getenv('PORT', 5001))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    try:
+        # The Flask dev server handles one request at a time; waitress
+        # gives the multi-user server real concurrency when run directly
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=port, threads=16)
+    except ImportError:
+        app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
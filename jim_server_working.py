@@ -1,24 +1,81 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import json
 from datetime import datetime
-from openai import OpenAI
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
+import asyncio
+import httpx
 import socket
 import threading
+import queue
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 import webbrowser
+import gzip
+import hashlib
 
 load_dotenv()
 
+# orjson serializes straight to bytes several times faster than the
+# stdlib; fall back quietly when it isn't installed
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# One event loop on a daemon thread runs every OpenAI call, so all
+# handler threads share a single pooled HTTP client
+_API_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_API_LOOP.run_forever, daemon=True).start()
+
+# TTS runs here so it can overlap the JSON response write
+TTS_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Cap in-flight completions so a burst of users degrades to queueing
+# here instead of 429s from the API
+OPENAI_SEM = threading.BoundedSemaphore(8)
+
+# Personal-detail patterns, compiled once; extraction runs on every turn
+_RE_NAME = re.compile(r"(?:[Mm]y name is|[Ii]'m|[Nn]ame:|[Cc]all me) (\w+)")
+_RE_LOCATION = re.compile(
+    r"\(([^)]+, [A-Z]{2})\)"            # (City, ST)
+    r"|(?:from|in) ([A-Z][a-z]+, [A-Z]{2})")  # from/in City, ST
+
 class JimRohnCoach:
     def __init__(self):
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.openai_client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            ),
+        )
         self.conversations = []
         
+        # Handlers run on separate threads; guard history/profile
+        # mutation and serialization (reentrant: ask_jim saves while
+        # already holding it)
+        self._memory_lock = threading.RLock()
+        
+        # /history serialization cache, invalidated by version bumps on
+        # every memory write
+        self._history_version = 0
+        self._history_cache = None
+        
+        # Rolling summary of conversations older than the message
+        # window; refreshed in the background every 10 turns
+        self._summary = ""
+        
         # Memory system files
         self.conversation_history_file = "conversation_history.json"
         self.user_profile_file = "user_profile.json"
@@ -39,6 +96,10 @@ class JimRohnCoach:
         
         print(f"📚 Loaded {len(self.conversation_history)} past conversations")
         print(f"🧠 User profile: {len(self.user_profile.get('recurring_themes', []))} themes tracked")
+        
+        # Disk writes happen on this thread, debounced to one per second
+        self._save_pending = False
+        threading.Thread(target=self._save_loop, daemon=True).start()
     
     def clean_text_for_speech(self, text: str) -> str:
         """Clean text for better speech synthesis by removing markdown and formatting."""
@@ -103,14 +164,71 @@ class JimRohnCoach:
             }
     
     def save_memory(self):
-        """Save both conversation history and user profile."""
-        # Save conversation history
-        with open(self.conversation_history_file, 'w') as f:
-            json.dump(self.conversation_history, f, indent=2)
+        """Mark memory dirty; the background thread flushes it to disk."""
+        with self._memory_lock:
+            self._history_version += 1
+            self._save_pending = True
+    
+    def _save_loop(self):
+        """Debounced writer: a storm of saves collapses into one flush."""
+        while True:
+            time.sleep(1)
+            if self._save_pending:
+                try:
+                    self.flush_memory()
+                except Exception as e:
+                    print(f"⚠️ Memory flush failed: {e}")
+    
+    def flush_memory(self):
+        """Write conversation history and user profile to disk atomically."""
+        # Serialize under the lock, write outside it; os.replace leaves
+        # each file either old or new, never truncated
+        with self._memory_lock:
+            self._save_pending = False
+            history_json = json.dumps(self.conversation_history, indent=2)
+            profile_json = json.dumps(self.user_profile, indent=2)
+        
+        tmp = self.conversation_history_file + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(history_json)
+        os.replace(tmp, self.conversation_history_file)
         
-        # Save user profile
-        with open(self.user_profile_file, 'w') as f:
-            json.dump(self.user_profile, f, indent=2)
+        tmp = self.user_profile_file + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(profile_json)
+        os.replace(tmp, self.user_profile_file)
+    
+    def api_call(self, **kwargs):
+        """Run a chat completion on the shared loop; blocks only the caller."""
+        with OPENAI_SEM:
+            future = asyncio.run_coroutine_threadsafe(
+                self.openai_client.chat.completions.create(**kwargs), _API_LOOP)
+            return future.result()
+    
+    def history_payload(self, offset=0, limit=50):
+        """Serialized /history bytes (plain and gzipped), rebuilt only
+        when memory changes."""
+        with self._memory_lock:
+            cached = self._history_cache
+            if cached and cached[0] == self._history_version and cached[1] == (offset, limit):
+                return cached[2], cached[3], cached[4]
+            
+            # Newest first, so the client can render without sorting
+            ordered = sorted(
+                self.conversation_history,
+                key=lambda c: c.get("timestamp", ""),
+                reverse=True,
+            )
+            body = _json_dumps({
+                "conversations": ordered[offset:offset + limit],
+                "user_profile": self.user_profile,
+                "total_conversations": len(self.conversation_history)
+            })
+            # Repeated keys compress well; tiny payloads aren't worth it
+            body_gz = gzip.compress(body) if len(body) > 512 else None
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            self._history_cache = (self._history_version, (offset, limit), body, body_gz, etag)
+            return body, body_gz, etag
     
     def analyze_conversation_patterns(self, user_question: str, jim_response: str):
         """Analyze conversation to extract themes and patterns."""
@@ -133,7 +251,7 @@ class JimRohnCoach:
             Keep responses concise and focus on actionable items.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = self.api_call(
                 model="gpt-4",
                 messages=[{"role": "system", "content": analysis_prompt}],
                 temperature=0.3,
@@ -176,40 +294,24 @@ class JimRohnCoach:
     def extract_personal_details(self, question: str, response: str):
         """Extract and update personal details from conversations."""
         try:
-            import re
-            
-            # Extract name if mentioned in introduction format
-            name_patterns = [
-                r"[Mm]y name is (\w+)",
-                r"[Ii]'m (\w+)",
-                r"[Nn]ame: (\w+)",
-                r"[Cc]all me (\w+)"
-            ]
-            
-            for pattern in name_patterns:
-                match = re.search(pattern, question)
+            # Extract name if mentioned in introduction format; skip the
+            # scan entirely once a name is on record
+            if not self.user_profile.get("name"):
+                match = _RE_NAME.search(question)
                 if match:
                     name = match.group(1).strip()
                     if name and len(name) > 1 and name.isalpha():
                         self.user_profile["name"] = name
                         print(f"💡 Extracted name: {name}")
-                        break
-            
-            # Extract location if mentioned
-            location_patterns = [
-                r"\(([^)]+, [A-Z]{2})\)",  # (City, ST)
-                r"from ([A-Z][a-z]+, [A-Z]{2})",  # from City, ST
-                r"in ([A-Z][a-z]+, [A-Z]{2})"     # in City, ST
-            ]
             
-            for pattern in location_patterns:
-                match = re.search(pattern, question)
+            # Extract location if mentioned, same short-circuit
+            if not self.user_profile.get("location"):
+                match = _RE_LOCATION.search(question)
                 if match:
-                    location = match.group(1).strip()
+                    location = (match.group(1) or match.group(2)).strip()
                     if location and "," in location:
                         self.user_profile["location"] = location
                         print(f"💡 Extracted location: {location}")
-                        break
                         
         except Exception as e:
             print(f"⚠️ Personal detail extraction failed: {e}")
@@ -257,82 +359,205 @@ class JimRohnCoach:
         
         return "\n".join(context) if context else ""
     
-    def ask_jim(self, question: str, generate_voice: bool = True) -> dict:
-        """Get Jim's response to a question."""
+    def synthesize(self, text):
+        """Generate TTS audio bytes for the text; None on failure."""
         try:
-            # Get conversation context from memory
-            context = self.get_conversation_context(question)
+            from elevenlabs import ElevenLabs
             
-            # Build enhanced system prompt with memory context
-            enhanced_prompt = self.system_prompt
-            if context:
-                enhanced_prompt += f"\n\n=== MEMORY CONTEXT ===\n{context}\n\nUse this context to provide more personalized advice. Reference past conversations when relevant, but don't make it obvious unless it naturally fits the conversation."
+            elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            
+            # Clean text for speech synthesis
+            clean_text = self.clean_text_for_speech(text)
+            
+            # Use the correct API method and convert generator to bytes
+            audio_generator = elevenlabs_client.text_to_speech.convert(
+                voice_id=os.getenv("JIM_ROHN_VOICE_ID"),
+                text=clean_text,
+                model_id="eleven_monolingual_v1"
+            )
+            audio_data = b"".join(audio_generator)
+            print(f"✅ Generated voice response ({len(audio_data)} bytes)")
+            return audio_data
             
-            response = self.openai_client.chat.completions.create(
+        except Exception as voice_error:
+            print(f"⚠️ Voice generation failed: {voice_error}")
+            return None
+    
+    def build_messages(self, question: str):
+        """Build the messages list: system prompt, summary, recent turns.
+        
+        Only the last few turns ride along verbatim — sending the whole
+        history would make every request slower and pricier as it grows.
+        Older turns are represented by the rolling summary instead.
+        """
+        context = self.get_conversation_context(question)
+        enhanced_prompt = self.system_prompt
+        if context:
+            enhanced_prompt += f"\n\n=== MEMORY CONTEXT ===\n{context}\n\nUse this context to provide more personalized advice. Reference past conversations when relevant, but don't make it obvious unless it naturally fits the conversation."
+        if self._summary:
+            enhanced_prompt += f"\n\n=== SUMMARY OF EARLIER CONVERSATIONS ===\n{self._summary}"
+        
+        messages = [{"role": "system", "content": enhanced_prompt}]
+        with self._memory_lock:
+            recent = list(self.conversation_history[-4:])
+        for convo in recent:
+            messages.append({"role": "user", "content": convo["question"]})
+            messages.append({"role": "assistant", "content": convo["response"]})
+        messages.append({"role": "user", "content": question})
+        return messages
+    
+    def maybe_refresh_summary(self):
+        """Every 10 turns, rebuild the rolling summary off-thread."""
+        with self._memory_lock:
+            total = len(self.conversation_history)
+            if total < 10 or total % 10 != 0:
+                return
+            older = list(self.conversation_history[-30:-4])
+        if not older:
+            return
+        
+        def _summarize():
+            try:
+                lines = [f"Q: {c['question'][:200]}\nA: {c['response'][:200]}" for c in older]
+                response = self.api_call(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "user", "content": "Summarize these coaching conversations in at most 6 lines. Keep names, goals, and recurring struggles:\n\n" + "\n\n".join(lines)}
+                    ],
+                    temperature=0.3,
+                    max_tokens=200
+                )
+                self._summary = response.choices[0].message.content
+                print("✅ Refreshed conversation summary")
+            except Exception as e:
+                print(f"⚠️ Summary refresh failed: {e}")
+        
+        threading.Thread(target=_summarize, daemon=True).start()
+    
+    def stream_completion(self, question: str):
+        """Yield response tokens as they arrive from the API."""
+        messages = self.build_messages(question)
+        
+        # The async client pumps the stream on the API loop; tokens
+        # cross to this thread through a queue
+        token_q = queue.Queue()
+        
+        async def _pump():
+            try:
+                stream = await self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=1000,
+                    stream=True
+                )
+                async for chunk in stream:
+                    token_q.put(chunk.choices[0].delta.content or "")
+                token_q.put(None)
+            except Exception as e:
+                token_q.put(e)
+        
+        with OPENAI_SEM:
+            asyncio.run_coroutine_threadsafe(_pump(), _API_LOOP)
+            while True:
+                item = token_q.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if item:
+                    yield item
+    
+    def finish_stream(self, question: str, jim_response: str, generate_voice: bool):
+        """Record a streamed exchange; analysis runs off-thread."""
+        audio_future = None
+        if generate_voice and os.getenv("ELEVENLABS_API_KEY") and os.getenv("JIM_ROHN_VOICE_ID"):
+            audio_future = TTS_POOL.submit(self.synthesize, jim_response)
+        
+        conversation = {
+            "question": question,
+            "response": jim_response,
+            "timestamp": datetime.now().isoformat(),
+            "has_audio": audio_future is not None,
+            "is_favorite": False
+        }
+        with self._memory_lock:
+            self.conversations.append(conversation)
+            self.conversation_history.append(conversation)
+            self.user_profile["total_conversations"] = len(self.conversation_history)
+            self.user_profile["last_conversation"] = conversation["timestamp"]
+            if not self.user_profile.get("first_conversation"):
+                self.user_profile["first_conversation"] = conversation["timestamp"]
+            self.save_memory()
+        
+        self.maybe_refresh_summary()
+        self.extract_personal_details(question, jim_response)
+        
+        # Pattern analysis is its own API call; the done event must not
+        # wait for it
+        def _analyze():
+            self.analyze_conversation_patterns(question, jim_response)
+            self.save_memory()
+        threading.Thread(target=_analyze, daemon=True).start()
+        
+        return {
+            "conversation_count": len(self.conversations),
+            "audio_future": audio_future
+        }
+    
+    def ask_jim(self, question: str, generate_voice: bool = True) -> dict:
+        """Get Jim's response to a question."""
+        try:
+            response = self.api_call(
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": enhanced_prompt},
-                    {"role": "user", "content": question}
-                ],
+                messages=self.build_messages(question),
                 temperature=0.7,
                 max_tokens=1000
             )
             
             jim_response = response.choices[0].message.content
             
-            # Generate voice if requested and API key is available
-            audio_data = None
+            # Kick TTS off in parallel: the memory bookkeeping and the
+            # JSON response don't need to wait for audio, and /audio/<id>
+            # blocks on the future only when the browser actually fetches
+            audio_future = None
             if generate_voice and os.getenv("ELEVENLABS_API_KEY") and os.getenv("JIM_ROHN_VOICE_ID"):
-                try:
-                    from elevenlabs import ElevenLabs
-                    import re
-                    
-                    elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-                    
-                    # Clean text for speech synthesis
-                    clean_text = self.clean_text_for_speech(jim_response)
-                    
-                    # Use the correct API method and convert generator to bytes
-                    audio_generator = elevenlabs_client.text_to_speech.convert(
-                        voice_id=os.getenv("JIM_ROHN_VOICE_ID"),
-                        text=clean_text,
-                        model_id="eleven_monolingual_v1"
-                    )
-                    audio_data = b"".join(audio_generator)
-                    print(f"✅ Generated voice response ({len(audio_data)} bytes)")
-                    
-                except Exception as voice_error:
-                    print(f"⚠️ Voice generation failed: {voice_error}")
-                    audio_data = None
+                audio_future = TTS_POOL.submit(self.synthesize, jim_response)
             
             # Store conversation in memory system
             conversation = {
                 "question": question,
                 "response": jim_response,
                 "timestamp": datetime.now().isoformat(),
-                "has_audio": audio_data is not None,
+                "has_audio": audio_future is not None,
                 "is_favorite": False
             }
-            self.conversations.append(conversation)
-            self.conversation_history.append(conversation)
+            with self._memory_lock:
+                self.conversations.append(conversation)
+                self.conversation_history.append(conversation)
             
-            # Extract personal details and analyze patterns
+            # Extract personal details and analyze patterns (the analysis
+            # makes its own API call, so the lock is not held here)
             self.extract_personal_details(question, jim_response)
             self.analyze_conversation_patterns(question, jim_response)
-            self.user_profile["total_conversations"] = len(self.conversation_history)
-            self.user_profile["last_conversation"] = conversation["timestamp"]
-            if not self.user_profile.get("first_conversation"):
-                self.user_profile["first_conversation"] = conversation["timestamp"]
             
-            # Save memory to disk
-            self.save_memory()
+            with self._memory_lock:
+                self.user_profile["total_conversations"] = len(self.conversation_history)
+                self.user_profile["last_conversation"] = conversation["timestamp"]
+                if not self.user_profile.get("first_conversation"):
+                    self.user_profile["first_conversation"] = conversation["timestamp"]
+                
+                # Save memory to disk
+                self.save_memory()
+            
+            self.maybe_refresh_summary()
             
             return {
                 "success": True,
                 "response": jim_response,
                 "conversation_count": len(self.conversations),
-                "audio": audio_data,
-                "has_voice": audio_data is not None
+                "audio": audio_future,
+                "has_voice": audio_future is not None
             }
             
         except Exception as e:
@@ -344,8 +569,120 @@ class JimRohnCoach:
                 "has_voice": False
             }
 
+class BatchScheduler:
+    """Coalesce questions that arrive close together into one OpenAI call."""
+
+    def __init__(self, coach, max_batch=8, window=0.05):
+        self.coach = coach
+        self.max_batch = max_batch
+        self.window = window
+        self.queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, question):
+        future = Future()
+        self.queue.put((question, future))
+        return future
+
+    def _run(self):
+        while True:
+            items = [self.queue.get()]
+            deadline = time.time() + self.window
+            while len(items) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            if len(items) == 1:
+                # Nothing to amortize; take the normal path
+                question, future = items[0]
+                try:
+                    future.set_result(self.coach.ask_jim(question, generate_voice=False))
+                except Exception as e:
+                    future.set_exception(e)
+            else:
+                self._dispatch(items)
+
+    def _dispatch(self, items):
+        """Answer a batch of questions with a single completion call."""
+        try:
+            numbered = "\n".join(f"{i + 1}. {q}" for i, (q, _) in enumerate(items))
+            instruction = (
+                f"Several people are asking you questions at once. Answer each "
+                f"numbered question in your own voice, as if speaking to that "
+                f"person alone. Return ONLY a JSON array of {len(items)} strings, "
+                f"one full answer per question, in order.\n\n{numbered}"
+            )
+            
+            response = self.coach.api_call(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": self.coach.system_prompt},
+                    {"role": "user", "content": instruction}
+                ],
+                temperature=0.7,
+                max_tokens=1000 * len(items)
+            )
+            
+            answers = json.loads(response.choices[0].message.content)
+            if not isinstance(answers, list) or len(answers) != len(items):
+                raise ValueError("Batch reply did not match question count")
+            
+            # One memory write for the whole batch
+            with self.coach._memory_lock:
+                for (question, _), answer in zip(items, answers):
+                    conversation = {
+                        "question": question,
+                        "response": answer,
+                        "timestamp": datetime.now().isoformat(),
+                        "has_audio": False,
+                        "is_favorite": False
+                    }
+                    self.coach.conversations.append(conversation)
+                    self.coach.conversation_history.append(conversation)
+                self.coach.user_profile["total_conversations"] = len(self.coach.conversation_history)
+                self.coach.save_memory()
+            
+            for (_, future), answer in zip(items, answers):
+                future.set_result({
+                    "success": True,
+                    "response": answer,
+                    "conversation_count": len(self.coach.conversations),
+                    "audio": None,
+                    "has_voice": False
+                })
+            print(f"✅ Answered {len(items)} questions in one API call")
+            
+        except Exception as e:
+            # Batch call or parse failed: fall back to one call each
+            print(f"⚠️ Batch dispatch failed, answering individually: {e}")
+            for question, future in items:
+                try:
+                    future.set_result(self.coach.ask_jim(question, generate_voice=False))
+                except Exception as single_error:
+                    future.set_exception(single_error)
+
 # Initialize coach
 coach = JimRohnCoach()
+ask_scheduler = BatchScheduler(coach)
+
+# Raw TTS audio parked briefly for pickup by /audio/<id>
+AUDIO_CACHE = OrderedDict()
+AUDIO_MAX = 64
+AUDIO_LOCK = threading.Lock()
+
+def stash_audio(audio):
+    """Park audio (bytes or a pending future) and return its fetch id."""
+    aid = uuid.uuid4().hex
+    with AUDIO_LOCK:
+        AUDIO_CACHE[aid] = audio
+        while len(AUDIO_CACHE) > AUDIO_MAX:
+            AUDIO_CACHE.popitem(last=False)
+    return aid
 
 # HTML template with professional dark mode design
 HTML_CONTENT = '''<!DOCTYPE html>
@@ -355,660 +692,8 @@ HTML_CONTENT = '''<!DOCTYPE html>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Jim Rohn AI Coach</title>
     <!-- Version 2.0 - Modern Buttons -->
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
-            background: linear-gradient(135deg, #0b1220 0%, #0b1220 50%, #0d1020 100%);
-            color: #f4f4f5;
-            min-height: 100vh;
-            overflow: hidden;
-        }
-
-        .app-container {
-            display: flex;
-            height: 100vh;
-            width: 100vw;
-        }
-
-        /* Sidebar Styles */
-        .sidebar {
-            width: 300px;
-            background: rgba(39, 39, 42, 0.4);
-            border-right: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 16px;
-            margin: 8px;
-            display: flex;
-            flex-direction: column;
-            overflow: hidden;
-        }
-
-        .sidebar-header {
-            padding: 16px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            background: transparent;
-        }
-
-        .sidebar-title {
-            color: #f0f6fc;
-            font-size: 1.2em;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-
-        .sidebar-subtitle {
-            color: #8b949e;
-            font-size: 0.85em;
-        }
-
-        .conversation-list {
-            flex: 1;
-            overflow-y: auto;
-            padding: 10px 0;
-        }
-
-        .conversation-item {
-            padding: 12px 20px;
-            border-bottom: 1px solid #21262d;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            position: relative;
-        }
-
-        .conversation-item:hover {
-            background: #21262d;
-        }
-
-        .conversation-question {
-            color: #f0f6fc;
-            font-size: 0.9em;
-            margin-bottom: 5px;
-            line-height: 1.4;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }
-
-        .conversation-meta {
-            color: #8b949e;
-            font-size: 0.75em;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .conversation-star {
-            color: #ffd700;
-            font-size: 0.8em;
-        }
-
-        .sidebar-footer {
-            padding: 15px 20px;
-            border-top: 1px solid #30363d;
-        }
-
-        .view-more-btn {
-            width: 100%;
-            padding: 8px 12px;
-            background: rgba(39, 39, 42, 0.7);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            color: #a1a1aa;
-            font-size: 12px;
-            cursor: pointer;
-            transition: background 0.2s ease;
-            font-weight: 500;
-            box-shadow: none;
-        }
-
-        .view-more-btn:hover {
-            background: rgba(39, 39, 42, 0.9);
-        }
-
-        /* Main Content Area */
-        .main-content {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            background: transparent;
-        }
-
-        .main-header {
-            padding: 16px 24px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            background: transparent;
-        }
-
-        .main-title {
-            color: #f4f4f5;
-            font-size: 1.5em;
-            margin-bottom: 4px;
-            font-weight: 600;
-            letter-spacing: 0.025em;
-        }
-
-        .main-subtitle {
-            color: #8b949e;
-            font-style: italic;
-            font-size: 0.95em;
-        }
-
-        .chat-container {
-            flex: 1;
-            overflow-y: auto;
-            padding: 16px;
-            margin: 0 24px;
-            background: rgba(9, 9, 11, 0.4);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 16px;
-            position: relative;
-        }
-
-        .chat-container::before {
-            content: '';
-            position: absolute;
-            inset: 0;
-            background: radial-gradient(ellipse at top, rgba(6, 182, 212, 0.1), transparent);
-            border-radius: 16px;
-            pointer-events: none;
-        }
-
-        .message {
-            margin-bottom: 20px;
-            padding: 16px 20px;
-            border-radius: 12px;
-            animation: slideIn 0.3s ease-out;
-            border: 1px solid #30363d;
-        }
-
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        .user-message {
-            background: #0f1419;
-            border-left: 3px solid #2ea043;
-            margin-left: 40px;
-        }
-
-        .jim-message {
-            background: #161b22;
-            border-left: 3px solid #1f6feb;
-            margin-right: 40px;
-        }
-
-        .message-header {
-            font-weight: 600;
-            margin-bottom: 8px;
-            color: #f0f6fc;
-            font-size: 0.9em;
-        }
-
-        .message-content {
-            line-height: 1.6;
-            color: #e6edf3;
-            white-space: pre-wrap;
-        }
-
-        /* Input Section */
-        .input-section {
-            padding: 12px 24px;
-            margin: 12px 24px 24px 24px;
-            background: rgba(39, 39, 42, 0.5);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 16px;
-        }
-
-        .input-row {
-            display: flex;
-            gap: 15px;
-            margin-bottom: 15px;
-        }
-
-        .voice-controls-row {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            margin-bottom: 15px;
-        }
-
-        .voice-label {
-            color: #a1a1aa;
-            font-size: 12px;
-            font-weight: 500;
-        }
-
-        .mic-button {
-            display: grid;
-            place-items: center;
-            width: 40px;
-            height: 40px;
-            background: rgba(9, 9, 11, 0.6);
-            color: #a1a1aa;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: all 0.2s ease;
-            box-shadow: none;
-            position: relative;
-        }
-
-        .mic-button:hover:not(:disabled) {
-            background: rgba(39, 39, 42, 0.8);
-            border-color: rgba(6, 182, 212, 0.4);
-        }
-
-        .mic-button.recording {
-            background: rgba(6, 182, 212, 0.2);
-            border-color: rgba(6, 182, 212, 0.5);
-            color: #a5f3fc;
-        }
-
-        .mic-button.recording::after {
-            content: '';
-            position: absolute;
-            inset: 0;
-            border-radius: 12px;
-            animation: micPulse 1.6s infinite ease-out;
-        }
-
-        @keyframes micPulse {
-            0% { box-shadow: 0 0 0 0 rgba(6, 182, 212, 0.35); }
-            50% { box-shadow: 0 0 0 6px rgba(6, 182, 212, 0.20); }
-            100% { box-shadow: 0 0 0 12px rgba(6, 182, 212, 0.05); }
-        }
-
-        .voice-controls {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .audio-visualizer {
-            display: flex;
-            align-items: end;
-            justify-content: center;
-            height: 32px;
-            background: rgba(39, 39, 42, 0.6);
-            border-radius: 8px;
-            padding: 4px 8px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: all 0.3s ease;
-            box-shadow: none;
-            gap: 1px;
-            overflow: hidden;
-        }
-
-        .audio-visualizer.active {
-            background: rgba(9, 9, 11, 0.6);
-            border-color: rgba(6, 182, 212, 0.4);
-        }
-
-        .visualizer-bar {
-            width: 2px;
-            background: rgba(212, 212, 216, 0.5);
-            border-radius: 1px;
-            height: 4px;
-            transition: all 0.3s ease;
-            transform-origin: bottom;
-        }
-
-        .audio-visualizer.active .visualizer-bar {
-            background: rgba(212, 212, 216, 0.8);
-            animation: audioWave 1.8s ease-in-out infinite;
-        }
-
-        @keyframes audioWave {
-            0%, 100% { height: 8px; opacity: 0.7; }
-            50% { height: 24px; opacity: 1; }
-        }
-
-        .visualizer-bar:nth-child(1) { animation-delay: 0.1s; }
-        .visualizer-bar:nth-child(2) { animation-delay: 0.2s; }
-        .visualizer-bar:nth-child(3) { animation-delay: 0.3s; }
-        .visualizer-bar:nth-child(4) { animation-delay: 0.4s; }
-        .visualizer-bar:nth-child(5) { animation-delay: 0.5s; }
-        .visualizer-bar:nth-child(6) { animation-delay: 0.6s; }
-        .visualizer-bar:nth-child(7) { animation-delay: 0.7s; }
-        .visualizer-bar:nth-child(8) { animation-delay: 0.8s; }
-        .visualizer-bar:nth-child(9) { animation-delay: 0.9s; }
-        .visualizer-bar:nth-child(10) { animation-delay: 1.0s; }
-        .visualizer-bar:nth-child(11) { animation-delay: 0.8s; }
-        .visualizer-bar:nth-child(12) { animation-delay: 0.6s; }
-        .visualizer-bar:nth-child(13) { animation-delay: 0.4s; }
-        .visualizer-bar:nth-child(14) { animation-delay: 0.2s; }
-        .visualizer-bar:nth-child(15) { animation-delay: 0.0s; }
-
-        .voice-button {
-            display: inline-flex;
-            align-items: center;
-            gap: 4px;
-            padding: 6px 12px;
-            background: rgba(6, 182, 212, 0.2);
-            color: #a5f3fc;
-            border: 1px solid rgba(6, 182, 212, 0.4);
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 12px;
-            font-weight: 500;
-            transition: background 0.2s ease;
-            white-space: nowrap;
-            box-shadow: none;
-        }
-
-        .voice-button:hover {
-            background: rgba(6, 182, 212, 0.3);
-        }
-
-        .voice-button.disabled {
-            background: rgba(39, 39, 42, 0.6);
-            border-color: rgba(255, 255, 255, 0.1);
-            color: #a1a1aa;
-            cursor: default;
-        }
-
-        .voice-button.disabled:hover {
-            background: rgba(39, 39, 42, 0.6);
-        }
-
-        .recording-status {
-            color: #dc3545;
-            font-weight: bold;
-            font-size: 12px;
-            text-align: center;
-            margin-top: 10px;
-            animation: pulse 1.5s infinite;
-        }
-
-        .question-input {
-            flex: 1;
-            padding: 8px 12px;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            font-size: 15px;
-            resize: none;
-            min-height: 40px;
-            max-height: 160px;
-            font-family: inherit;
-            background: rgba(9, 9, 11, 0.6);
-            color: #f4f4f5;
-            transition: border-color 0.2s ease;
-        }
-
-        .question-input:focus {
-            outline: none;
-            border-color: rgba(6, 182, 212, 0.4);
-        }
-
-        .question-input::placeholder {
-            color: #71717a;
-        }
-
-        .question-input::placeholder {
-            color: #8b949e;
-        }
-
-        .ask-button {
-            display: inline-flex;
-            align-items: center;
-            gap: 8px;
-            padding: 8px 12px;
-            background: rgba(6, 182, 212, 0.2);
-            color: #a5f3fc;
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 500;
-            transition: background 0.2s ease;
-            min-width: 80px;
-            box-shadow: none;
-        }
-
-        .ask-button:hover:not(:disabled) {
-            background: rgba(6, 182, 212, 0.3);
-        }
-
-        .ask-button:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
-            background: rgba(113, 118, 129, 0.3);
-        }
-
-        .stats {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            color: #8b949e;
-            font-size: 13px;
-        }
-
-        .status-indicator {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            background: #2ea043;
-            border-radius: 50%;
-            margin-right: 8px;
-            animation: pulse 2s infinite;
-        }
-
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.5; }
-            100% { opacity: 1; }
-        }
-
-        .loading {
-            animation: pulse 1.5s ease-in-out infinite;
-        }
-
-        .status-info {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0,0,0,0.8);
-        }
-
-        .modal-content {
-            background-color: #161b22;
-            margin: 2% auto;
-            padding: 20px;
-            border-radius: 12px;
-            width: 90%;
-            max-width: 1000px;
-            max-height: 90%;
-            overflow-y: auto;
-            position: relative;
-            border: 1px solid #30363d;
-        }
-
-        .close {
-            color: #8b949e;
-            float: right;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-            line-height: 20px;
-        }
-
-        .close:hover {
-            color: #f0f6fc;
-        }
-
-        .history-header {
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 1px solid #30363d;
-            color: #f0f6fc;
-        }
-
-        .profile-summary {
-            background: #0d1117;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            border: 1px solid #30363d;
-        }
-
-        .history-conversation {
-            margin-bottom: 15px;
-            padding: 15px;
-            border: 1px solid #30363d;
-            border-radius: 8px;
-            background: #21262d;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-
-        .history-conversation:hover {
-            background: #30363d;
-            border-color: #1f6feb;
-        }
-
-        .history-conversation.expanded {
-            background: #0f1419;
-            border-color: #1f6feb;
-        }
-
-        .history-timestamp {
-            font-size: 12px;
-            color: #8b949e;
-            margin-bottom: 8px;
-        }
-
-        .history-question {
-            font-weight: 600;
-            color: #2ea043;
-            margin-bottom: 8px;
-        }
-
-        .history-response {
-            color: #e6edf3;
-            line-height: 1.4;
-        }
-
-        .history-response.truncated {
-            max-height: 60px;
-            overflow: hidden;
-            position: relative;
-        }
-
-        .history-response.truncated::after {
-            content: '... Click to read full response';
-            position: absolute;
-            bottom: 0;
-            right: 0;
-            background: linear-gradient(to right, transparent, #21262d 50%);
-            padding-left: 20px;
-            color: #1f6feb;
-            font-style: italic;
-            font-size: 12px;
-        }
-
-        .expand-indicator {
-            float: right;
-            color: #1f6feb;
-            font-size: 12px;
-            font-weight: bold;
-        }
-
-        .favorite-button {
-            float: right;
-            background: none;
-            border: none;
-            font-size: 16px;
-            cursor: pointer;
-            padding: 2px 4px;
-            border-radius: 4px;
-            transition: all 0.2s ease;
-            color: #8b949e;
-            margin-left: 8px;
-        }
-
-        .favorite-button:hover {
-            background: rgba(255, 215, 0, 0.1);
-            transform: scale(1.1);
-        }
-
-        .favorite-button.favorited {
-            color: #ffd700;
-        }
-
-        .favorite-button.favorited:hover {
-            color: #ffed4a;
-        }
-
-        .favorites-filter {
-            margin: 15px 0;
-            text-align: center;
-        }
-
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .sidebar {
-                width: 250px;
-            }
-            
-            .main-header {
-                padding: 15px 20px;
-            }
-            
-            .main-title {
-                font-size: 1.5em;
-            }
-            
-            .chat-container {
-                padding: 15px 20px;
-            }
-            
-            .input-section {
-                padding: 15px 20px;
-            }
-        }
-
-        .filter-button {
-            padding: 6px 14px;
-            margin: 0 4px;
-            border: 1px solid #1f6feb;
-            background: transparent;
-            color: #1f6feb;
-            border-radius: 50px;
-            cursor: pointer;
-            font-size: 12px;
-            transition: all 0.2s ease;
-            font-weight: 500;
-            box-shadow: none;
-        }
-
-        .filter-button.active {
-            background: #1f6feb;
-            color: white;
-        }
-
-        .filter-button:hover {
-            background: #1f6feb;
-            color: white;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/jim.css">
+    <link rel="preload" href="/history" as="fetch" crossorigin>
 </head>
 <body>
     <div class="app-container">
@@ -1059,21 +744,7 @@ HTML_CONTENT = '''<!DOCTYPE html>
                     </button>
                     
                     <div class="audio-visualizer" id="audioVisualizer">
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
-                        <div class="visualizer-bar"></div>
+                        <div class="visualizer-wave"></div>
                     </div>
 
                     <div class="recording-status" id="recordingStatus" style="display: none;">
@@ -1124,6 +795,21 @@ HTML_CONTENT = '''<!DOCTYPE html>
         </div>
     </div>
 
+    <!-- Row templates cloned by the renderers -->
+    <template id="convItemTpl">
+        <div class="conversation-item">
+            <div class="conversation-question" data-field="q"></div>
+            <div class="conversation-meta"><span data-field="meta"></span><span class="conversation-star" data-field="star" hidden> ⭐</span></div>
+        </div>
+    </template>
+    <template id="historyRowTpl">
+        <div class="history-conversation">
+            <div class="history-timestamp"><span data-field="date"></span><button class="favorite-button">☆</button><span class="expand-indicator" hidden></span></div>
+            <div class="history-question"></div>
+            <div class="history-response">A: <span class="response-text"></span></div>
+        </div>
+    </template>
+
     <script>
         let conversationCount = 0;
         let recognition = null;
@@ -1131,59 +817,144 @@ HTML_CONTENT = '''<!DOCTYPE html>
         let voiceEnabled = true;
         let audioUnlocked = false;
 
+        // Coalesced /history fetch: concurrent callers share one request
+        // and a recent result is reused instead of hitting the server again
+        let historyPromise = null;
+        let historyCacheTs = 0;
+
+        function getHistory(maxAgeMs = 2000) {
+            const now = Date.now();
+            if (historyPromise && now - historyCacheTs < maxAgeMs) {
+                return historyPromise;
+            }
+            historyCacheTs = now;
+            historyPromise = fetch('/history')
+                .then(response => response.json())
+                .then(data => {
+                    // Parse each timestamp once; everything downstream
+                    // works with the numeric value
+                    for (const c of (data.conversations || [])) {
+                        c._t = Date.parse(c.timestamp);
+                    }
+                    return data;
+                });
+            historyPromise.catch(() => { historyPromise = null; });
+            return historyPromise;
+        }
+
+        // Start the fetch immediately: the preload in <head> has usually
+        // already pulled the response in parallel with the HTML parse
+        getHistory();
+
         // Load conversation count and recent conversations
         async function loadConversationCount() {
             try {
-                const response = await fetch('/history');
-                const data = await response.json();
+                const data = await getHistory();
                 conversationCount = data.total_conversations || 0;
                 document.getElementById('conversationCount').textContent = conversationCount;
                 
                 // Populate sidebar with recent conversations
-                loadRecentConversations(data.conversations || []);
+                scheduleSidebar(data.conversations || []);
             } catch (error) {
                 console.warn('Failed to load conversation count:', error);
             }
         }
 
         // Load recent conversations in sidebar
+        const convItemTpl = document.getElementById('convItemTpl');
+        const historyRowTpl = document.getElementById('historyRowTpl');
+
+        // Rendered sidebar rows keyed by timestamp, so refreshes reuse
+        // nodes instead of rebuilding the whole list
+        const sidebarRows = new Map();
+        let sidebarSignature = '';
+
+        // Coalesce sidebar rebuilds to one per animation frame; several
+        // refresh paths firing in the same tick render once
+        let sidebarFrameScheduled = false;
+        let sidebarPending = null;
+
+        function scheduleSidebar(conversations) {
+            sidebarPending = conversations;
+            if (sidebarFrameScheduled) return;
+            sidebarFrameScheduled = true;
+            requestAnimationFrame(() => {
+                sidebarFrameScheduled = false;
+                loadRecentConversations(sidebarPending);
+                sidebarPending = null;
+            });
+        }
+
         function loadRecentConversations(conversations) {
             const container = document.getElementById('recentConversations');
             if (!conversations || conversations.length === 0) {
                 container.innerHTML = '<div class="conversation-item"><div class="conversation-question">No conversations yet</div><div class="conversation-meta">Start chatting!</div></div>';
+                sidebarRows.clear();
+                sidebarSignature = '';
                 return;
             }
 
-            // Sort by timestamp (newest first) and take last 10
-            const recent = conversations
-                .sort((a, b) => new Date(b.timestamp) - new Date(a.timestamp))
-                .slice(0, 10);
-
-            let html = '';
-            recent.forEach((conv, index) => {
-                const date = new Date(conv.timestamp);
-                const timeAgo = getTimeAgo(date);
-                const truncatedQuestion = conv.question.length > 60 
-                    ? conv.question.substring(0, 60) + '...'
-                    : conv.question;
-                
-                html += `<div class="conversation-item" onclick="openConversationInHistory('${conv.timestamp}')">`;
-                html += `<div class="conversation-question">${truncatedQuestion}</div>`;
-                html += `<div class="conversation-meta">`;
-                html += `${timeAgo}`;
-                if (conv.is_favorite) {
-                    html += ` <span class="conversation-star">⭐</span>`;
+            // Server returns newest first; just take the top 10
+            const recent = conversations.slice(0, 10);
+
+            // Same rows as last render: only the relative times can have
+            // changed, so update those and skip the diff
+            const signature = recent.map(c => c.timestamp + (c.is_favorite ? '*' : '')).join('|');
+            if (signature === sidebarSignature) {
+                for (const conv of recent) {
+                    const node = sidebarRows.get(conv.timestamp);
+                    if (node) {
+                        node.querySelector('[data-field=meta]').textContent = getTimeAgo(conv._t);
+                    }
                 }
-                html += `</div></div>`;
-            });
-
-            container.innerHTML = html;
+                return;
+            }
+            sidebarSignature = signature;
+
+            // Reuse nodes for timestamps already rendered; only new rows
+            // are cloned, dropped rows fall out of the map
+            const seen = new Set();
+            const frag = document.createDocumentFragment();
+            for (const conv of recent) {
+                let node = sidebarRows.get(conv.timestamp);
+                if (!node) {
+                    node = convItemTpl.content.firstElementChild.cloneNode(true);
+                    const truncatedQuestion = conv.question.length > 60 
+                        ? conv.question.substring(0, 60) + '...'
+                        : conv.question;
+                    node.querySelector('[data-field=q]').textContent = truncatedQuestion;
+                    node.dataset.ts = conv.timestamp;
+                    sidebarRows.set(conv.timestamp, node);
+                }
+                node.querySelector('[data-field=meta]').textContent = getTimeAgo(conv._t);
+                node.querySelector('[data-field=star]').hidden = !conv.is_favorite;
+                seen.add(conv.timestamp);
+                frag.appendChild(node);
+            }
+            for (const ts of [...sidebarRows.keys()]) {
+                if (!seen.has(ts)) sidebarRows.delete(ts);
+            }
+            container.replaceChildren(frag);
         }
 
         // Helper function to get time ago
-        function getTimeAgo(date) {
-            const now = new Date();
-            const diffMs = now - date;
+        // Relative times only change once a minute; key the cache on
+        // (current minute, row minute) so refreshes are a Map hit
+        const _tagoCache = new Map();
+
+        function getTimeAgo(ms) {
+            const key = Math.floor(Date.now() / 60000) * 1e13 + Math.floor(ms / 60000);
+            let label = _tagoCache.get(key);
+            if (label === undefined) {
+                if (_tagoCache.size > 2000) _tagoCache.clear();
+                label = computeTimeAgo(ms);
+                _tagoCache.set(key, label);
+            }
+            return label;
+        }
+
+        function computeTimeAgo(ms) {
+            const diffMs = Date.now() - ms;
             const diffMins = Math.floor(diffMs / 60000);
             const diffHours = Math.floor(diffMs / 3600000);
             const diffDays = Math.floor(diffMs / 86400000);
@@ -1192,7 +963,7 @@ HTML_CONTENT = '''<!DOCTYPE html>
             if (diffMins < 60) return `${diffMins}m ago`;
             if (diffHours < 24) return `${diffHours}h ago`;
             if (diffDays < 7) return `${diffDays}d ago`;
-            return date.toLocaleDateString();
+            return new Date(ms).toLocaleDateString();
         }
 
         // Open specific conversation in history modal
@@ -1201,6 +972,11 @@ HTML_CONTENT = '''<!DOCTYPE html>
             // TODO: Could add logic to highlight/scroll to specific conversation
         }
 
+        // Hot-path element refs, resolved once instead of per event
+        const micButtonEl = document.getElementById('micButton');
+        const recordingStatusEl = document.getElementById('recordingStatus');
+        const audioVisualizerEl = document.getElementById('audioVisualizer');
+
         // Initialize speech recognition
         if ('webkitSpeechRecognition' in window || 'SpeechRecognition' in window) {
             const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
@@ -1211,14 +987,14 @@ HTML_CONTENT = '''<!DOCTYPE html>
             
             recognition.onstart = function() {
                 isRecording = true;
-                document.getElementById('micButton').classList.add('recording');
-                document.getElementById('recordingStatus').style.display = 'block';
+                micButtonEl.classList.add('recording');
+                recordingStatusEl.style.display = 'block';
             };
             
             recognition.onend = function() {
                 isRecording = false;
-                document.getElementById('micButton').classList.remove('recording');
-                document.getElementById('recordingStatus').style.display = 'none';
+                micButtonEl.classList.remove('recording');
+                recordingStatusEl.style.display = 'none';
             };
             
             recognition.onresult = function(event) {
@@ -1268,17 +1044,100 @@ HTML_CONTENT = '''<!DOCTYPE html>
         }
 
         function showAudioVisualizer() {
-            const visualizer = document.getElementById('audioVisualizer');
-            if (visualizer) {
-                visualizer.classList.add('active');
+            if (audioVisualizerEl) {
+                audioVisualizerEl.classList.add('active');
             }
         }
 
         function hideAudioVisualizer() {
-            const visualizer = document.getElementById('audioVisualizer');
-            if (visualizer) {
-                visualizer.classList.remove('active');
+            if (audioVisualizerEl) {
+                audioVisualizerEl.classList.remove('active');
+            }
+        }
+
+        // Windowed rendering for the history list: only the rows near the
+        // viewport are materialized, with padding standing in for the rest
+        const HISTORY_OVERSCAN = 5;
+        let historyItemHeight = 140;  // estimate, refined from measured rows
+        let historyListEl = null;
+        let historyScrollHooked = false;
+        let historyFramePending = false;
+
+        function buildHistoryRow(conversation, index) {
+            const node = historyRowTpl.content.firstElementChild.cloneNode(true);
+            const isLong = conversation.response.length > 200;
+            const expanded = conversation.expanded || false;
+            const isFavorite = conversation.is_favorite || false;
+            
+            node.classList.add(isFavorite ? 'favorites-only' : 'all-conversations');
+            if (expanded) node.classList.add('expanded');
+            node.dataset.idx = index;
+            node.dataset.ts = conversation.timestamp;
+            
+            node.querySelector('[data-field=date]').textContent = new Date(conversation.timestamp).toLocaleString();
+            
+            const favButton = node.querySelector('.favorite-button');
+            favButton.textContent = isFavorite ? '⭐' : '☆';
+            if (isFavorite) favButton.classList.add('favorited');
+            
+            const indicator = node.querySelector('.expand-indicator');
+            if (isLong) {
+                indicator.hidden = false;
+                indicator.textContent = expanded ? '▲ Click to collapse' : '▼ Click to expand';
             }
+            
+            node.querySelector('.history-question').textContent = 'Q: ' + conversation.question;
+            
+            const responseEl = node.querySelector('.history-response');
+            if (isLong && !expanded) responseEl.classList.add('truncated');
+            
+            const textEl = node.querySelector('.response-text');
+            textEl.textContent = (isLong && !expanded) ? conversation.response.substring(0, 200) : conversation.response;
+            
+            // Refs for toggleConversation, so clicks don't pay id lookups
+            node._refs = { response: responseEl, text: textEl, indicator: isLong ? indicator : null };
+            
+            return node;
+        }
+
+        function renderHistoryWindow() {
+            if (!historyListEl) return;
+            const scroller = document.getElementById('historyContent');
+            const total = conversationsData.length;
+            const viewHeight = scroller.clientHeight || 600;
+            
+            let start = Math.floor(scroller.scrollTop / historyItemHeight) - HISTORY_OVERSCAN;
+            let end = start + Math.ceil(viewHeight / historyItemHeight) + HISTORY_OVERSCAN * 2;
+            start = Math.max(0, start);
+            end = Math.min(total, end);
+            
+            historyListEl.style.paddingTop = (start * historyItemHeight) + 'px';
+            historyListEl.style.paddingBottom = ((total - end) * historyItemHeight) + 'px';
+            
+            const frag = document.createDocumentFragment();
+            for (let index = start; index < end; index++) {
+                frag.appendChild(buildHistoryRow(conversationsData[index], index));
+            }
+            historyListEl.replaceChildren(frag);
+            
+            // Refine the height estimate from what actually rendered
+            const rows = historyListEl.children;
+            if (rows.length > 3) {
+                const measured = historyListEl.offsetHeight / rows.length;
+                if (measured > 40 && Math.abs(measured - historyItemHeight) > 10) {
+                    historyItemHeight = Math.round(measured);
+                }
+            }
+        }
+
+        function onHistoryScroll() {
+            // Coalesce scroll events to one re-render per frame
+            if (historyFramePending) return;
+            historyFramePending = true;
+            requestAnimationFrame(() => {
+                historyFramePending = false;
+                renderHistoryWindow();
+            });
         }
 
         function showHistory() {
@@ -1292,10 +1151,12 @@ HTML_CONTENT = '''<!DOCTYPE html>
             }
             
             modal.style.display = 'block';
+            // Layer hint only while the modal is up; dropped on close
+            // so the GPU memory isn't held permanently
+            modal.querySelector('.modal-content').style.willChange = 'transform';
             content.innerHTML = '<p>Loading history...</p>';
             
-            fetch('/history')
-                .then(response => response.json())
+            getHistory()
                 .then(data => {
                     let html = '';
                     
@@ -1326,68 +1187,92 @@ HTML_CONTENT = '''<!DOCTYPE html>
                         
                         // Add filter buttons
                         html += '<div class="favorites-filter">';
-                        html += '<button class="filter-button active" onclick="filterConversations(&apos;all&apos;)">All Conversations</button>';
-                        html += '<button class="filter-button" onclick="filterConversations(&apos;favorites&apos;)">Favorites Only</button>';
+                        html += '<button class="filter-button active" data-filter="all">All Conversations</button>';
+                        html += '<button class="filter-button" data-filter="favorites">Favorites Only</button>';
                         html += '</div>';
                         
-                        // Sort conversations by timestamp (newest first)
-                        const sortedConversations = data.conversations.sort((a, b) => 
-                            new Date(b.timestamp) - new Date(a.timestamp)
-                        );
-                        
-                        // Store conversations data globally for click handlers
-                        conversationsData = sortedConversations;
+                        // Store conversations data globally for click
+                        // handlers (already newest-first from the server)
+                        conversationsData = data.conversations;
                         
-                        sortedConversations.forEach((conversation, index) => {
-                            const date = new Date(conversation.timestamp).toLocaleString();
-                            const isLong = conversation.response.length > 200;
-                            const truncatedResponse = isLong ? conversation.response.substring(0, 200) : conversation.response;
-                            const isFavorite = conversation.is_favorite || false;
-                            const favoriteClass = isFavorite ? 'favorites-only' : 'all-conversations';
-                            
-                            html += `<div class="history-conversation ${favoriteClass}" onclick="toggleConversation(${index})">`;
-                            html += `<div class="history-timestamp">${date}`;
-                            
-                            // Add favorite button in header
-                            html += `<button class="favorite-button ${isFavorite ? 'favorited' : ''}" onclick="event.stopPropagation(); toggleFavorite('${conversation.timestamp}', ${index})">`;
-                            html += isFavorite ? '⭐' : '☆';
-                            html += '</button>';
-                            
-                            if (isLong) {
-                                html += `<span class="expand-indicator" id="indicator-${index}">▼ Click to expand</span>`;
-                            }
-                            html += `</div>`;
-                            html += `<div class="history-question">Q: ${conversation.question}</div>`;
-                            html += `<div class="history-response ${isLong ? 'truncated' : ''}" id="response-${index}">`;
-                            html += `A: <span id="response-text-${index}">${truncatedResponse}</span>`;
-                            html += `</div>`;
-                            html += `<div style="display: none;" id="full-response-${index}">${conversation.response}</div>`;
-                            html += '</div>';
-                        });
+                        // Only the visible window of rows gets materialized
+                        content.innerHTML = html + '<div id="historyList"></div>';
+                        historyListEl = document.getElementById('historyList');
+                        if (!historyScrollHooked) {
+                            content.addEventListener('scroll', onHistoryScroll, { passive: true });
+                            // One delegated listener handles every row, star
+                            // and filter button, rendered now or later
+                            content.addEventListener('click', (e) => {
+                                const filterButton = e.target.closest('.filter-button');
+                                if (filterButton) {
+                                    filterConversations(filterButton.dataset.filter);
+                                    return;
+                                }
+                                const row = e.target.closest('.history-conversation');
+                                if (!row) return;
+                                const idx = +row.dataset.idx;
+                                if (e.target.closest('.favorite-button')) {
+                                    toggleFavorite(conversationsData[idx].timestamp, idx);
+                                } else {
+                                    toggleConversation(idx, row);
+                                }
+                            });
+                            historyScrollHooked = true;
+                        }
+                        content.scrollTop = 0;
+                        renderHistoryWindow();
+
+                        // First page is on screen; stream in the rest
+                        // while the user reads
+                        loadRemainingHistory(data.total_conversations);
                     } else {
                         html += '<p>No conversation history yet. Start chatting with Jim!</p>';
+                        content.innerHTML = html;
+                        historyListEl = null;
                     }
-                    
-                    content.innerHTML = html;
                 })
                 .catch(error => {
                     content.innerHTML = '<p>Error loading history: ' + error.message + '</p>';
                 });
         }
 
+        // Fetch history beyond the first page in background batches,
+        // re-rendering the window as each batch arrives
+        let historyTailLoading = false;
+        async function loadRemainingHistory(total) {
+            if (historyTailLoading || conversationsData.length >= total) return;
+            historyTailLoading = true;
+            try {
+                while (conversationsData.length < total) {
+                    const response = await fetch(`/history?offset=${conversationsData.length}&limit=200`);
+                    const page = await response.json();
+                    const batch = page.conversations || [];
+                    if (batch.length === 0) break;
+                    for (const c of batch) c._t = Date.parse(c.timestamp);
+                    conversationsData.push(...batch);
+                    renderHistoryWindow();
+                }
+            } catch (error) {
+                console.warn('Failed to load older history:', error);
+            } finally {
+                historyTailLoading = false;
+            }
+        }
+
         function closeHistory() {
-            document.getElementById('historyModal').style.display = 'none';
+            const modal = document.getElementById('historyModal');
+            modal.querySelector('.modal-content').style.willChange = '';
+            modal.style.display = 'none';
         }
 
         // Toggle conversation expansion
-        function toggleConversation(index) {
+        function toggleConversation(index, row) {
             const conversation = conversationsData[index];
-            const responseElement = document.getElementById(`response-${index}`);
-            const responseTextElement = document.getElementById(`response-text-${index}`);
-            const indicator = document.getElementById(`indicator-${index}`);
-            const conversationDiv = responseElement.closest('.history-conversation');
+            const { response: responseElement, text: responseTextElement, indicator } = row._refs;
+            const conversationDiv = row;
             
             const isExpanded = conversationDiv.classList.contains('expanded');
+            conversation.expanded = !isExpanded;  // survives window remounts
             
             if (isExpanded) {
                 // Collapse
@@ -1423,31 +1308,21 @@ HTML_CONTENT = '''<!DOCTYPE html>
                 
                 if (data.success) {
                     // Update the conversation data
-                    conversationsData[index].is_favorite = !conversationsData[index].is_favorite;
-                    
-                    // Update the star button - find by data attributes instead of onclick
-                    const buttons = document.querySelectorAll('.favorite-button');
-                    let button = null;
-                    buttons.forEach(btn => {
-                        if (btn.onclick && btn.onclick.toString().includes(timestamp)) {
-                            button = btn;
-                        }
-                    });
-                    if (button) {
-                        if (conversationsData[index].is_favorite) {
-                            button.classList.add('favorited');
-                            button.textContent = '⭐';
-                        } else {
-                            button.classList.remove('favorited');
-                            button.textContent = '☆';
-                        }
-                    }
+                    const isFavorite = !conversationsData[index].is_favorite;
+                    conversationsData[index].is_favorite = isFavorite;
                     
-                    // Update conversation classes for filtering
-                    const conversationDiv = button.closest('.history-conversation');
-                    if (conversationDiv) {
-                        conversationDiv.classList.remove('all-conversations', 'favorites-only');
-                        conversationDiv.classList.add(conversationsData[index].is_favorite ? 'favorites-only' : 'all-conversations');
+                    // Rows carry data-ts, so the star is one indexed query
+                    // away (the row may be outside the rendered window)
+                    const row = document.querySelector(
+                        '.history-conversation[data-ts="' + CSS.escape(timestamp) + '"]');
+                    if (row) {
+                        const button = row.querySelector('.favorite-button');
+                        button.classList.toggle('favorited', isFavorite);
+                        button.textContent = isFavorite ? '⭐' : '☆';
+                        
+                        // Update conversation classes for filtering
+                        row.classList.remove('all-conversations', 'favorites-only');
+                        row.classList.add(isFavorite ? 'favorites-only' : 'all-conversations');
                     }
                 } else {
                     alert('Failed to update favorite status');
@@ -1458,28 +1333,22 @@ HTML_CONTENT = '''<!DOCTYPE html>
             }
         }
         
-        // Filter conversations by type
+        // Filter conversations by type (debounced so rapid button clicks
+        // collapse into a single re-filter pass)
+        let filterTimer = null;
         function filterConversations(type) {
-            const buttons = document.querySelectorAll('.filter-button');
-            const conversations = document.querySelectorAll('.history-conversation');
-            
-            // Update button states
-            buttons.forEach(btn => {
-                btn.classList.remove('active');
-                if ((type === 'all' && btn.textContent.includes('All Conversations')) ||
-                    (type === 'favorites' && btn.textContent.includes('Favorites'))) {
-                    btn.classList.add('active');
-                }
-            });
-            
-            // Show/hide conversations
-            conversations.forEach(conv => {
-                if (type === 'all') {
-                    conv.style.display = 'block';
-                } else if (type === 'favorites') {
-                    const isFavorite = conv.classList.contains('favorites-only');
-                    conv.style.display = isFavorite ? 'block' : 'none';
-                }
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(() => applyConversationFilter(type), 150);
+        }
+
+        function applyConversationFilter(type) {
+            // One class flip on the container; the stylesheet hides the
+            // non-favorites instead of us touching each row's style
+            const content = document.getElementById('historyContent');
+            content.classList.toggle('filter-favorites', type === 'favorites');
+
+            document.querySelectorAll('.filter-button').forEach(btn => {
+                btn.classList.toggle('active', btn.dataset.filter === type);
             });
         }
 
@@ -1496,6 +1365,19 @@ HTML_CONTENT = '''<!DOCTYPE html>
         let pendingAudio = null;
         let conversationsData = [];
 
+        // One reusable audio element: swapping src releases the previous
+        // buffer instead of piling up a fresh Audio object per reply
+        const sharedAudio = new Audio();
+        sharedAudio.volume = 0.8;
+        sharedAudio.onended = () => {
+            hideAudioVisualizer();
+            console.log('Audio playback completed');
+        };
+        sharedAudio.onerror = (e) => {
+            console.error('Audio playback error:', e);
+            hideAudioVisualizer();
+        };
+
         function createAudioUnlockButton() {
             // Remove any existing button
             const existingButton = document.getElementById('audioUnlockButton');
@@ -1573,40 +1455,18 @@ HTML_CONTENT = '''<!DOCTYPE html>
             document.body.appendChild(button);
         }
 
-        async function playAudioDirect(audioData) {
+        async function playAudioDirect(audioUrl) {
             try {
-                console.log('Playing audio directly, data length:', audioData.length);
+                console.log('Playing audio from', audioUrl);
                 
                 showAudioVisualizer();
                 
-                // Convert base64 to binary string, then to Uint8Array
-                const binaryString = atob(audioData);
-                const bytes = new Uint8Array(binaryString.length);
-                for (let i = 0; i < binaryString.length; i++) {
-                    bytes[i] = binaryString.charCodeAt(i);
-                }
-                
-                // Create audio with MP3 format
-                const audioBlob = new Blob([bytes], { type: 'audio/mpeg' });
-                const audioUrl = URL.createObjectURL(audioBlob);
-                
-                const audio = new Audio(audioUrl);
-                audio.volume = 0.8;
-                
-                audio.onended = () => {
-                    URL.revokeObjectURL(audioUrl);
-                    hideAudioVisualizer();
-                    console.log('Audio playback completed');
-                };
-                
-                audio.onerror = (e) => {
-                    console.error('Audio playback error:', e);
-                    URL.revokeObjectURL(audioUrl);
-                    hideAudioVisualizer();
-                };
+                // The browser fetches and decodes the stream itself and
+                // can start playing before the download finishes
+                sharedAudio.src = audioUrl;
                 
                 // Play the audio
-                await audio.play();
+                await sharedAudio.play();
                 console.log('Audio playing successfully');
                         
             } catch (error) {
@@ -1616,18 +1476,18 @@ HTML_CONTENT = '''<!DOCTYPE html>
             }
         }
 
-        async function playAudio(audioData) {
+        async function playAudio(audioUrl) {
             try {
                 // Check if audio is unlocked
                 if (!audioUnlocked || !globalAudioContext) {
                     console.log('Audio not unlocked, storing for later and showing unlock button');
-                    pendingAudio = audioData;
+                    pendingAudio = audioUrl;
                     createAudioUnlockButton();
                     return;
                 }
                 
                 // Audio is unlocked, play directly
-                await playAudioDirect(audioData);
+                await playAudioDirect(audioUrl);
                         
             } catch (error) {
                 console.error('Audio processing failed:', error);
@@ -1635,7 +1495,7 @@ HTML_CONTENT = '''<!DOCTYPE html>
                 
                 if (error.name === 'NotAllowedError') {
                     console.log('Audio blocked, showing unlock button');
-                    pendingAudio = audioData;
+                    pendingAudio = audioUrl;
                     createAudioUnlockButton();
                 } else {
                     // Other error, show message
@@ -1679,47 +1539,78 @@ HTML_CONTENT = '''<!DOCTYPE html>
                     headers: {
                         'Content-Type': 'application/x-www-form-urlencoded',
                     },
-                    body: 'question=' + encodeURIComponent(question) + '&voice=' + voiceEnabled
+                    body: 'question=' + encodeURIComponent(question) + '&voice=' + voiceEnabled + '&stream=true'
                 });
 
-                const text = await response.text();
-                const data = JSON.parse(text);
+                if (!response.ok || !response.body) {
+                    throw new Error('Request failed: ' + response.status);
+                }
 
-                // Remove loading message
+                // First token replaces the loading message; the rest
+                // append as they arrive
                 chatContainer.removeChild(loadingMessage);
-
-                if (data.success) {
-                    // Add Jim's response
-                    const messageElement = addMessage('Jim Rohn', data.response, 'jim-message');
-                    
-                    // Play audio if available
-                    if (data.has_voice && data.audio && voiceEnabled) {
-                        try {
-                            await playAudio(data.audio);
-                            // Add audio indicator to message
-                            const audioIcon = document.createElement('span');
-                            audioIcon.innerHTML = ' 🔊';
-                            audioIcon.style.color = '#28a745';
-                            audioIcon.title = 'Audio response available';
-                            messageElement.querySelector('.message-header').appendChild(audioIcon);
-                        } catch (audioError) {
-                            console.error('Audio playback error:', audioError);
+                const messageElement = addMessage('Jim Rohn', '', 'jim-message');
+                const contentEl = messageElement.querySelector('.message-content');
+
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                let done = null;
+                let failed = null;
+                while (true) {
+                    const { done: eof, value } = await reader.read();
+                    if (eof) break;
+                    buffer += decoder.decode(value, { stream: true });
+                    let sep;
+                    while ((sep = buffer.indexOf('\n\n')) >= 0) {
+                        const frame = buffer.slice(0, sep);
+                        buffer = buffer.slice(sep + 2);
+                        let event = 'message';
+                        let payload = '';
+                        for (const line of frame.split('\n')) {
+                            if (line.startsWith('event: ')) event = line.slice(7);
+                            else if (line.startsWith('data: ')) payload += line.slice(6);
+                        }
+                        if (!payload) continue;
+                        const parsed = JSON.parse(payload);
+                        if (event === 'done') {
+                            done = parsed;
+                        } else if (event === 'error') {
+                            failed = parsed;
+                        } else if (parsed.t) {
+                            contentEl.textContent += parsed.t;
+                            chatContainer.scrollTop = chatContainer.scrollHeight;
                         }
                     }
-                    
-                    // Update conversation count and refresh sidebar
-                    conversationCount = data.conversation_count;
-                    document.getElementById('conversationCount').textContent = conversationCount;
-                    statusText.textContent = 'Connected & Ready';
-                    
-                    // Refresh recent conversations in sidebar
-                    loadConversationCount();
-                } else {
-                    // Add error message
-                    addMessage('Jim Rohn', data.response, 'jim-message');
-                    statusText.textContent = 'Technical difficulty - please try again';
                 }
 
+                if (failed || !done) {
+                    throw new Error(failed ? failed.error : 'Stream ended early');
+                }
+
+                // Play audio if available
+                if (done.has_voice && done.audio_url && voiceEnabled) {
+                    try {
+                        await playAudio(done.audio_url);
+                        // Add audio indicator to message
+                        const audioIcon = document.createElement('span');
+                        audioIcon.innerHTML = ' 🔊';
+                        audioIcon.style.color = '#28a745';
+                        audioIcon.title = 'Audio response available';
+                        messageElement.querySelector('.message-header').appendChild(audioIcon);
+                    } catch (audioError) {
+                        console.error('Audio playback error:', audioError);
+                    }
+                }
+
+                // Update conversation count and refresh sidebar
+                conversationCount = done.conversation_count;
+                document.getElementById('conversationCount').textContent = conversationCount;
+                statusText.textContent = 'Connected & Ready';
+
+                // Refresh recent conversations in sidebar
+                loadConversationCount();
+
             } catch (error) {
                 console.error('Error:', error);
                 
@@ -1761,6 +1652,14 @@ HTML_CONTENT = '''<!DOCTYPE html>
             return message;
         }
 
+        // One delegated click handler covers every sidebar row
+        document.getElementById('recentConversations').addEventListener('click', (e) => {
+            const item = e.target.closest('.conversation-item');
+            if (item && item.dataset.ts) {
+                openConversationInHistory(item.dataset.ts);
+            }
+        });
+
         // Allow Enter to send message
         document.getElementById('questionInput').addEventListener('keydown', function(e) {
             if (e.key === 'Enter' && !e.shiftKey) {
@@ -1776,147 +1675,323 @@ HTML_CONTENT = '''<!DOCTYPE html>
 </body>
 </html>'''
 
+# Stylesheet ships as its own asset so the browser caches it across
+# page loads; read and gzip it once at import
+_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "jim.css")
+with open(_CSS_PATH, "rb") as _f:
+    CSS_BYTES = _f.read()
+CSS_GZIP = gzip.compress(CSS_BYTES, 9)
+
+# Encode and compress the page once at import; do_GET just picks a buffer
+HTML_BYTES = HTML_CONTENT.encode('utf-8')
+HTML_GZ = gzip.compress(HTML_BYTES, 9)
+HTML_ETAG = '"' + hashlib.sha1(HTML_BYTES).hexdigest() + '"'
+HTML_LEN = str(len(HTML_BYTES))
+HTML_GZ_LEN = str(len(HTML_GZ))
+
+def _get_field(post_data, name):
+    """Pull one form field without building a full parse_qs dict."""
+    prefix = name + '='
+    for part in post_data.split('&'):
+        if part.startswith(prefix):
+            return urllib.parse.unquote_plus(part[len(prefix):])
+    return ''
+
 class JimRequestHandler(BaseHTTPRequestHandler):
+    # Persistent connections: every branch must send an exact
+    # Content-Length or the browser will hang waiting for more body
+    protocol_version = 'HTTP/1.1'
+    # Without this Nagle holds the header packet back waiting for the
+    # body write, adding ~40ms to small responses like /ask JSON
+    disable_nagle_algorithm = True
+    
     def log_message(self, format, *args):
         pass
     
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
+            # The shell is a constant per process: revalidation is one
+            # ETag compare, and a match skips the whole body
+            if self.headers.get('If-None-Match') == HTML_ETAG:
+                self.send_response(304)
+                self.send_header('ETag', HTML_ETAG)
+                self.end_headers()
+                return
+            accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = HTML_GZ if accepts_gzip else HTML_BYTES
             self.send_response(200)
             self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
+            self.send_header('Cache-Control', 'public, max-age=60, must-revalidate')
+            self.send_header('ETag', HTML_ETAG)
+            if accepts_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', HTML_GZ_LEN if accepts_gzip else HTML_LEN)
             self.end_headers()
-            self.wfile.write(HTML_CONTENT.encode('utf-8'))
-        elif self.path == '/history':
+            self.wfile.write(body)
+        elif self.path == '/static/jim.css':
+            accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = CSS_GZIP if accepts_gzip else CSS_BYTES
+            self.send_response(200)
+            self.send_header('Content-type', 'text/css; charset=utf-8')
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+            if accepts_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path.split('?', 1)[0] == '/history':
             try:
-                history_data = {
-                    "conversations": coach.conversation_history[-50:],
-                    "user_profile": coach.user_profile,
-                    "total_conversations": len(coach.conversation_history)
-                }
+                # Optional paging: /history?offset=50&limit=200 lets the
+                # client pull the long tail after the first page renders
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                offset = int(query.get('offset', ['0'])[0])
+                limit = int(query.get('limit', ['50'])[0])
+                body, body_gz, etag = coach.history_payload(offset, limit)
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                accepts_gzip = body_gz is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+                payload = body_gz if accepts_gzip else body
                 self.send_response(200)
-                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-type', 'application/json; charset=utf-8')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Cache-Control', 'max-age=0, must-revalidate')
+                self.send_header('ETag', etag)
+                self.send_header('Vary', 'Accept-Encoding')
+                if accepts_gzip:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(payload)))
                 self.end_headers()
-                self.wfile.write(json.dumps(history_data).encode('utf-8'))
+                self.wfile.write(payload)
             except Exception as e:
+                error_response = _json_dumps({"error": str(e)})
                 self.send_response(500)
-                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(error_response)))
                 self.end_headers()
-                error_response = json.dumps({"error": str(e)})
-                self.wfile.write(error_response.encode('utf-8'))
+                self.wfile.write(error_response)
+        elif self.path.startswith('/audio/'):
+            aid = self.path[len('/audio/'):]
+            with AUDIO_LOCK:
+                audio = AUDIO_CACHE.get(aid)
+            if isinstance(audio, Future):
+                # TTS still running; this handler thread waits, not /ask
+                try:
+                    audio = audio.result(timeout=60)
+                except Exception:
+                    audio = None
+                if audio is not None:
+                    with AUDIO_LOCK:
+                        AUDIO_CACHE[aid] = audio
+            if audio is None:
+                self.send_response(404)
+                self.send_header('Content-type', 'text/plain')
+                self.send_header('Content-Length', str(len(b'Audio expired')))
+                self.end_headers()
+                self.wfile.write(b'Audio expired')
+            else:
+                self.send_response(200)
+                self.send_header('Content-type', 'audio/mpeg')
+                self.send_header('Content-Length', str(len(audio)))
+                self.send_header('Cache-Control', 'private, max-age=3600')
+                self.send_header('Accept-Ranges', 'bytes')
+                self.end_headers()
+                self.wfile.write(audio)
         elif self.path == '/toggle-favorite':
             # Handle favorite toggling
+            body = _json_dumps({"success": True})
             self.send_response(200)
-            self.send_header('Content-type', 'application/json')
+            self.send_header('Content-type', 'application/json; charset=utf-8')
             self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
+            self.wfile.write(body)
         else:
             self.send_response(404)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(b'404 - Not Found')))
             self.end_headers()
             self.wfile.write(b'404 - Not Found')
     
+    def _stream_ask(self, question, voice_enabled):
+        """Answer over SSE so the browser renders tokens as they arrive."""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        # SSE has no Content-Length; closing delimits the stream
+        self.close_connection = True
+        
+        parts = []
+        try:
+            for token in coach.stream_completion(question):
+                parts.append(token)
+                self.wfile.write(b'data: ' + _json_dumps({"t": token}) + b'\n\n')
+                self.wfile.flush()
+        except Exception as e:
+            self.wfile.write(b'event: error\ndata: ' + _json_dumps({"error": str(e)}) + b'\n\n')
+            self.wfile.flush()
+            return
+        
+        info = coach.finish_stream(question, ''.join(parts), voice_enabled)
+        done = {"conversation_count": info["conversation_count"], "has_voice": False}
+        if info["audio_future"] is not None:
+            done["audio_url"] = '/audio/' + stash_audio(info["audio_future"])
+            done["has_voice"] = True
+        self.wfile.write(b'event: done\ndata: ' + _json_dumps(done) + b'\n\n')
+        self.wfile.flush()
+    
     def do_POST(self):
         if self.path == '/ask':
             try:
                 content_length = int(self.headers.get('Content-Length', 0))
                 post_data = self.rfile.read(content_length).decode('utf-8')
-                params = urllib.parse.parse_qs(post_data)
-                question = params.get('question', [''])[0]
-                voice_enabled = params.get('voice', ['false'])[0].lower() == 'true'
+                question = _get_field(post_data, 'question')
+                voice_enabled = _get_field(post_data, 'voice').lower() == 'true'
+                
+                if question and _get_field(post_data, 'stream') == 'true':
+                    self._stream_ask(question, voice_enabled)
+                    return
                 
                 if question:
-                    result = coach.ask_jim(question, generate_voice=voice_enabled)
+                    if voice_enabled:
+                        # TTS is per-text, so voiced asks skip the batcher
+                        result = coach.ask_jim(question, generate_voice=True)
+                    else:
+                        result = ask_scheduler.submit(question).result()
                     
-                    # Convert audio data to base64 for JSON transmission
+                    # Audio goes out raw via its own endpoint; the JSON
+                    # only carries the URL
                     if result.get('audio'):
-                        import base64
-                        result['audio'] = base64.b64encode(result['audio']).decode('utf-8')
+                        result['audio_url'] = '/audio/' + stash_audio(result['audio'])
+                    result.pop('audio', None)
                     
-                    response_text = json.dumps(result)
+                    body = _json_dumps(result)
                 else:
-                    response_text = json.dumps({
+                    body = _json_dumps({
                         "success": False,
                         "response": "Please ask me something!"
                     })
                 
                 self.send_response(200)
-                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-type', 'application/json; charset=utf-8')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(response_text.encode('utf-8'))
+                self.wfile.write(body)
                 
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                error_response = json.dumps({
+                error_response = _json_dumps({
                     "success": False,
                     "response": f"Server error: {str(e)}"
                 })
-                self.wfile.write(error_response.encode('utf-8'))
+                self.send_response(500)
+                self.send_header('Content-type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(error_response)))
+                self.end_headers()
+                self.wfile.write(error_response)
         elif self.path == '/toggle-favorite':
             try:
                 content_length = int(self.headers.get('Content-Length', 0))
                 post_data = self.rfile.read(content_length).decode('utf-8')
-                params = urllib.parse.parse_qs(post_data)
-                timestamp = params.get('timestamp', [''])[0]
+                timestamp = _get_field(post_data, 'timestamp')
                 
                 if timestamp:
                     # Find conversation by timestamp and toggle favorite
-                    for conversation in coach.conversation_history:
-                        if conversation.get('timestamp') == timestamp:
-                            conversation['is_favorite'] = not conversation.get('is_favorite', False)
-                            break
-                    
-                    # Save updated history
-                    coach.save_memory()
+                    with coach._memory_lock:
+                        for conversation in coach.conversation_history:
+                            if conversation.get('timestamp') == timestamp:
+                                conversation['is_favorite'] = not conversation.get('is_favorite', False)
+                                break
+                        
+                        # Save updated history
+                        coach.save_memory()
                     
-                    response_text = json.dumps({"success": True})
+                    body = _json_dumps({"success": True})
                 else:
-                    response_text = json.dumps({"success": False, "error": "No timestamp provided"})
+                    body = _json_dumps({"success": False, "error": "No timestamp provided"})
                 
                 self.send_response(200)
-                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-type', 'application/json; charset=utf-8')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(response_text.encode('utf-8'))
+                self.wfile.write(body)
                 
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                error_response = json.dumps({
+                error_response = _json_dumps({
                     "success": False,
                     "error": str(e)
                 })
-                self.wfile.write(error_response.encode('utf-8'))
+                self.send_response(500)
+                self.send_header('Content-type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(error_response)))
+                self.end_headers()
+                self.wfile.write(error_response)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
-def find_available_port(start_port=9999):
-    for port in range(start_port, start_port + 100):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('127.0.0.1', port))
-                return port
-        except OSError:
-            continue
-    raise RuntimeError("No available ports found")
+class JimServer(ThreadingHTTPServer):
+    # One thread per request: / and /history stay responsive while an
+    # /ask is blocked on OpenAI
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    # Set before serve_forever; the browser opens the moment the socket
+    # is listening instead of after an arbitrary sleep
+    browser_url = None
+    
+    def server_activate(self):
+        super().server_activate()
+        if self.browser_url:
+            threading.Thread(target=_open_browser, args=(self.browser_url,), daemon=True).start()
 
-def open_browser_delayed(url, delay=2):
-    time.sleep(delay)
+def _open_browser(url):
     try:
         webbrowser.open(url)
         print(f"🌐 Opened {url} in your browser")
-    except:
+    except Exception:
         print(f"🌐 Please manually open: {url}")
 
+_PORT_FILE = ".jim_port"
+
+def find_available_port(start_port=9999):
+    # One probe socket reused across all candidates, and the port that
+    # worked last time is tried first so restarts keep the same URL
+    candidates = list(range(start_port, start_port + 100))
+    try:
+        with open(_PORT_FILE) as f:
+            last = int(f.read().strip())
+        if last in candidates:
+            candidates.remove(last)
+        candidates.insert(0, last)
+    except (OSError, ValueError):
+        pass
+    
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        for port in candidates:
+            try:
+                probe.bind(('127.0.0.1', port))
+            except OSError:
+                continue
+            try:
+                with open(_PORT_FILE, 'w') as f:
+                    f.write(str(port))
+            except OSError:
+                pass
+            return port
+    finally:
+        probe.close()
+    raise RuntimeError("No available ports found")
+
 def main():
     print("🧠 Jim Rohn AI Coach - Clean Working Version")
     print("=" * 50)
@@ -1929,26 +2004,24 @@ def main():
         print(f"❌ {e}")
         return
     
-    # Create and start server
+    # Create and start server; the browser opens as soon as the
+    # listening socket is live
+    url = f"http://127.0.0.1:{port}"
     server_address = ('127.0.0.1', port)
-    httpd = HTTPServer(server_address, JimRequestHandler)
+    JimServer.browser_url = url
+    httpd = JimServer(server_address, JimRequestHandler)
     
-    url = f"http://127.0.0.1:{port}"
     print(f"🌐 Jim Rohn AI Coach starting at: {url}")
     print("✅ Server is ready!")
     print("=" * 50)
     print("Press Ctrl+C to stop the server")
     
-    # Start browser opener in background
-    browser_thread = threading.Thread(target=open_browser_delayed, args=(url, 2))
-    browser_thread.daemon = True
-    browser_thread.start()
-    
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print(f"\n👋 Jim Rohn AI Coach shutting down...")
         print(f"💾 Served {len(coach.conversations)} conversations")
+        coach.flush_memory()
         httpd.shutdown()
         httpd.server_close()
         print("✅ Server stopped gracefully")
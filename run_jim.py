@@ -44,6 +44,24 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Read once at import: these files are constant for the process lifetime
+try:
+    with open('index.html', 'rb') as f:
+        INDEX_BYTES = f.read()
+except FileNotFoundError:
+    INDEX_BYTES = b'<h1>index.html not found</h1>'
+
+try:
+    with open('System prompt.txt', 'r') as f:
+        SYSTEM_PROMPT = f.read()
+except OSError:
+    SYSTEM_PROMPT = "You are Jim Rohn, the legendary personal development speaker."
+
+# One client for the whole process: the SDK keeps an httpx connection
+# pool inside it, so per-request construction throws away warm TLS
+# connections
+CLIENT = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
 class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
@@ -51,10 +69,7 @@ class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
             self.send_header('Content-type', 'text/html')
             self.end_headers()
             
-            with open('index.html', 'r') as f:
-                content = f.read()
-            
-            self.wfile.write(content.encode())
+            self.wfile.write(INDEX_BYTES)
         else:
             super().do_GET()
     
@@ -71,19 +86,10 @@ class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
                     response = {"error": "No question provided"}
                 else:
                     # Call OpenAI
-                    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                    
-                    # Load Jim Rohn prompt
-                    try:
-                        with open('System prompt.txt', 'r') as f:
-                            prompt = f.read()
-                    except:
-                        prompt = "You are Jim Rohn, the legendary personal development speaker."
-                    
-                    api_response = client.chat.completions.create(
+                    api_response = CLIENT.chat.completions.create(
                         model="gpt-4",
                         messages=[
-                            {"role": "system", "content": prompt},
+                            {"role": "system", "content": SYSTEM_PROMPT},
                             {"role": "user", "content": question}
                         ],
                         temperature=0.7
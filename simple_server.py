@@ -10,19 +10,40 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
+# Read once at import: these files are constant for the process lifetime
+try:
+    with open('index.html', 'rb') as f:
+        INDEX_BYTES = f.read()
+except FileNotFoundError:
+    INDEX_BYTES = b'<h1>index.html not found</h1>'
+
+try:
+    with open('System prompt.txt', 'r') as f:
+        SYSTEM_PROMPT = f.read()
+except OSError:
+    SYSTEM_PROMPT = "You are Jim Rohn, the legendary personal development speaker."
+
+# One client for the whole process: the SDK keeps an httpx connection
+# pool inside it, so per-request construction throws away warm TLS
+# connections
+CLIENT = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+class JimRohnHandler(http.server.BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response carries an
+    # exact Content-Length so the browser knows where the body ends
+    protocol_version = 'HTTP/1.1'
+    
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(INDEX_BYTES)))
             self.end_headers()
-            
-            with open('index.html', 'r') as f:
-                content = f.read()
-            
-            self.wfile.write(content.encode())
+            self.wfile.write(INDEX_BYTES)
         else:
-            super().do_GET()
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
     
     def do_POST(self):
         if self.path == '/ask':
@@ -37,19 +58,10 @@ class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
                     response = {"error": "No question provided"}
                 else:
                     # Call OpenAI
-                    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                    
-                    # Load Jim Rohn prompt
-                    try:
-                        with open('System prompt.txt', 'r') as f:
-                            prompt = f.read()
-                    except:
-                        prompt = "You are Jim Rohn, the legendary personal development speaker."
-                    
-                    api_response = client.chat.completions.create(
+                    api_response = CLIENT.chat.completions.create(
                         model="gpt-4",
                         messages=[
-                            {"role": "system", "content": prompt},
+                            {"role": "system", "content": SYSTEM_PROMPT},
                             {"role": "user", "content": question}
                         ],
                         temperature=0.7
@@ -60,22 +72,26 @@ class JimRohnHandler(http.server.SimpleHTTPRequestHandler):
                         "response": api_response.choices[0].message.content
                     }
                 
+                body = json.dumps(response).encode()
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
                 
-                self.wfile.write(json.dumps(response).encode())
+                self.wfile.write(body)
                 
             except Exception as e:
+                error_body = json.dumps({"error": str(e)}).encode()
                 self.send_response(500)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(error_body)))
                 self.end_headers()
                 
-                error_response = {"error": str(e)}
-                self.wfile.write(json.dumps(error_response).encode())
+                self.wfile.write(error_body)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
 if __name__ == "__main__":
@@ -84,5 +100,6 @@ if __name__ == "__main__":
     print(f"🌐 Open: http://localhost:{PORT}")
     print("Press Ctrl+C to stop")
     
-    with socketserver.TCPServer(("", PORT), JimRohnHandler) as httpd:
+    with socketserver.ThreadingTCPServer(("", PORT), JimRohnHandler) as httpd:
+        httpd.daemon_threads = True
         httpd.serve_forever()
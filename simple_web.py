@@ -2,57 +2,313 @@
 
 import os
 import json
+import gzip
+import math
+import time
+import queue
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Dict
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 
 load_dotenv()
 
+def _load_prompt() -> str:
+    try:
+        with open('System prompt.txt', 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return """You are Jim Rohn, the legendary personal development speaker. 
+        Respond with wisdom, warmth, and practical advice in your distinctive style."""
+
+# The prompt file never changes while the server runs: read it once and
+# share one immutable system message across every request
+_BASE_PROMPT = _load_prompt()
+_SYSTEM_MSG = {"role": "system", "content": _BASE_PROMPT}
+
+# Stable key so OpenAI's server-side prompt caching can dedupe the
+# static system-prompt prefix across requests
+_PROMPT_CACHE_KEY = hashlib.sha1(_BASE_PROMPT.encode()).hexdigest()
+
+# Most questions are short coaching prompts that the mini tier answers
+# well and much faster; only involved requests go to the big model
+_DEEP_KEYWORDS = ('analyze', 'plan', 'detailed', 'step by step')
+
+def _pick_model(question: str) -> str:
+    lowered = question.lower()
+    if len(question) < 200 and not any(k in lowered for k in _DEEP_KEYWORDS):
+        return "gpt-4o-mini"
+    return "gpt-4o"
+
+class _EmbedBatcher:
+    """Coalesce embedding requests that arrive close together into one call."""
+    
+    def __init__(self, client, max_batch=16, window=0.02):
+        self.client = client
+        self.max_batch = max_batch
+        self.window = window
+        self.queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def embed(self, question):
+        future = Future()
+        self.queue.put((question, future))
+        return future.result()
+    
+    def _run(self):
+        while True:
+            items = [self.queue.get()]
+            deadline = time.time() + self.window
+            while len(items) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                result = self.client.embeddings.create(
+                    model="text-embedding-3-small",
+                    input=[q for q, _ in items]
+                )
+                for (_, future), data in zip(items, result.data):
+                    future.set_result(data.embedding)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+
 class JimRohnCoach:
     def __init__(self):
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.conversations = []
+        # Explicit keep-alive pool: completions and embeddings reuse
+        # warm TLS connections to api.openai.com instead of
+        # re-handshaking
+        self.openai_client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=30.0
+            ),
+        )
+        # Ring buffer: a long-running server shouldn't grow without
+        # bound. Older entries live on in the JSONL spill file.
+        self.conversations = deque(maxlen=int(os.getenv('CONVO_HISTORY', '1000')))
+        self._total_count = 0
+        self._log = open('conversations.jsonl', 'a', buffering=1 << 16)
+        
+        # Handler threads share this instance; guard list mutation
+        self._lock = threading.Lock()
+        
+        # Repeat questions skip the API entirely: LRU of response text
+        # keyed on prompt+question
+        self._cache = OrderedDict()
+        self._cache_max = 512
         
-        # Load the prompt
+        # Semantic cache: rephrasings of an answered question reuse its
+        # response when the embeddings are close enough
+        self._sem_vectors = []
+        self._sem_responses = []
+        self._sem_threshold = 0.90
+        
+        # Concurrent embedding lookups within 20ms share one API call
+        self._embedder = _EmbedBatcher(self.openai_client)
+        
+        # Circuit breaker: after repeated API failures, fail fast for a
+        # while instead of pinning threads on a broken upstream
+        self._breaker = {'fails': 0, 'open_until': 0.0}
+        
+        # Persisting exchanges happens off-thread so a slow disk never
+        # stalls a response
+        self._log_q = queue.Queue(maxsize=10000)
+        self._log_dropped = 0
+        threading.Thread(target=self._log_worker, daemon=True).start()
+        self.base_prompt = _BASE_PROMPT
+    
+    def _embed(self, question: str):
+        """Unit-length embedding of the question, or None on failure."""
         try:
-            with open('System prompt.txt', 'r') as f:
-                self.base_prompt = f.read()
-        except FileNotFoundError:
-            self.base_prompt = """You are Jim Rohn, the legendary personal development speaker. 
-            Respond with wisdom, warmth, and practical advice in your distinctive style."""
+            vec = self._embedder.embed(question)
+            norm = math.sqrt(sum(v * v for v in vec))
+            return [v / norm for v in vec] if norm else None
+        except Exception:
+            return None
     
-    def ask_jim(self, question: str) -> Dict:
-        """Get Jim's response to a question."""
+    def _semantic_lookup(self, q_vec):
+        """Closest cached response at or above the similarity threshold."""
+        with self._lock:
+            entries = list(zip(self._sem_vectors, self._sem_responses))
+        best = None
+        best_sim = self._sem_threshold
+        for vec, response in entries:
+            sim = sum(a * b for a, b in zip(q_vec, vec))
+            if sim >= best_sim:
+                best_sim = sim
+                best = response
+        return best
+    
+    def _breaker_record(self, ok: bool):
+        with self._lock:
+            if ok:
+                self._breaker['fails'] = 0
+            elif self._breaker['fails'] >= 4:
+                self._breaker['open_until'] = time.time() + 30
+                self._breaker['fails'] = 0
+            else:
+                self._breaker['fails'] += 1
+    
+    def _log_worker(self):
+        """Drain queued exchanges to the JSONL log in batches."""
+        while True:
+            entries = [self._log_q.get()]
+            try:
+                while len(entries) < 100:
+                    entries.append(self._log_q.get_nowait())
+            except queue.Empty:
+                pass
+            for conversation in entries:
+                self._log.write(json.dumps(conversation) + '\n')
+            self._log.flush()
+    
+    def _record(self, question: str, jim_response: str) -> int:
+        """Store a finished exchange; returns the conversation count."""
+        conversation = {
+            "user": question,
+            "jim": jim_response,
+            "timestamp": datetime.now().isoformat()
+        }
+        with self._lock:
+            self.conversations.append(conversation)
+            self._total_count += 1
+            count = self._total_count
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
+            self._log_q.put_nowait(conversation)
+        except queue.Full:
+            self._log_dropped += 1
+        return count
+    
+    def stream_jim(self, question: str):
+        """Yield Jim's response in pieces; cached answers arrive whole."""
+        cache_key = hashlib.sha1((self.base_prompt + '\x00' + question).encode()).digest()
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        
+        q_vec = None
+        if cached is None:
+            q_vec = self._embed(question)
+            if q_vec is not None:
+                cached = self._semantic_lookup(q_vec)
+        
+        if cached is not None:
+            self._record(question, cached)
+            yield cached
+            return
+        
+        if time.time() < self._breaker['open_until']:
+            raise RuntimeError("API temporarily unavailable")
+        
+        parts = []
+        try:
+            stream = self.openai_client.chat.completions.create(
+                model=_pick_model(question),
                 messages=[
-                    {"role": "system", "content": self.base_prompt},
+                    _SYSTEM_MSG,
                     {"role": "user", "content": question}
                 ],
-                temperature=0.7
+                temperature=0.7,
+                timeout=20.0,
+                stream=True,
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
             )
+            for chunk in stream:
+                token = chunk.choices[0].delta.content or ""
+                if token:
+                    parts.append(token)
+                    yield token
+        except Exception:
+            self._breaker_record(False)
+            raise
+        self._breaker_record(True)
+        
+        jim_response = ''.join(parts)
+        with self._lock:
+            self._cache[cache_key] = jim_response
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+            if q_vec is not None:
+                self._sem_vectors.append(q_vec)
+                self._sem_responses.append(jim_response)
+                if len(self._sem_vectors) > self._cache_max:
+                    self._sem_vectors.pop(0)
+                    self._sem_responses.pop(0)
+        self._record(question, jim_response)
+    
+    def ask_jim(self, question: str) -> Dict:
+        """Get Jim's response to a question."""
+        cache_key = hashlib.sha1((self.base_prompt + '\x00' + question).encode()).digest()
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        
+        q_vec = None
+        if cached is None:
+            q_vec = self._embed(question)
+            if q_vec is not None:
+                cached = self._semantic_lookup(q_vec)
+        
+        try:
+            if cached is not None:
+                jim_response = cached
+            else:
+                if time.time() < self._breaker['open_until']:
+                    return {
+                        "success": False,
+                        "error": "circuit open",
+                        "response": "I'm having some technical difficulties right now. Give me a moment and try again."
+                    }
+                response = self.openai_client.chat.completions.create(
+                    model=_pick_model(question),
+                    messages=[
+                        _SYSTEM_MSG,
+                        {"role": "user", "content": question}
+                    ],
+                    temperature=0.7,
+                    timeout=20.0,
+                    extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
+                )
+                self._breaker_record(True)
+                
+                jim_response = response.choices[0].message.content
+                with self._lock:
+                    self._cache[cache_key] = jim_response
+                    if len(self._cache) > self._cache_max:
+                        self._cache.popitem(last=False)
+                    if q_vec is not None:
+                        self._sem_vectors.append(q_vec)
+                        self._sem_responses.append(jim_response)
+                        if len(self._sem_vectors) > self._cache_max:
+                            self._sem_vectors.pop(0)
+                            self._sem_responses.pop(0)
             
-            jim_response = response.choices[0].message.content
-            
-            # Store conversation
-            conversation = {
-                "user": question,
-                "jim": jim_response,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.conversations.append(conversation)
+            count = self._record(question, jim_response)
             
             return {
                 "success": True,
                 "response": jim_response,
-                "conversation_count": len(self.conversations)
+                "conversation_count": count
             }
             
         except Exception as e:
+            self._breaker_record(False)
             return {
                 "success": False,
                 "error": str(e),
@@ -62,145 +318,36 @@ class JimRohnCoach:
 # Initialize the coach
 coach = JimRohnCoach()
 
-HTML_PAGE = '''<!DOCTYPE html>
-<html>
-<head>
-    <title>🧠 Jim Rohn AI Coach</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body { 
-            font-family: Arial, sans-serif;
-            max-width: 800px; 
-            margin: 0 auto; 
-            padding: 20px; 
-            background: #f5f5f5;
-        }
-        .container {
-            background: white;
-            border-radius: 10px;
-            padding: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 { 
-            color: #333; 
-            text-align: center; 
-        }
-        .chat-area {
-            height: 400px;
-            overflow-y: auto;
-            border: 1px solid #ddd;
-            padding: 15px;
-            margin: 20px 0;
-            background: #f9f9f9;
-        }
-        .message {
-            margin: 10px 0;
-            padding: 10px;
-            border-radius: 5px;
-        }
-        .user { background: #e3f2fd; }
-        .jim { background: #f3e5f5; margin-top: 5px; }
-        .input-area {
-            display: flex;
-            gap: 10px;
-        }
-        input[type="text"] {
-            flex: 1;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }
-        button {
-            padding: 10px 20px;
-            background: #4CAF50;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        button:hover { background: #45a049; }
-        .stats { text-align: center; margin-top: 15px; color: #666; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🧠 Jim Rohn AI Coach</h1>
-        <div class="chat-area" id="chat">
-            <div class="message jim"><strong>Jim Rohn:</strong> Welcome! I'm here to help with your personal development. What's on your mind?</div>
-        </div>
-        <div class="input-area">
-            <input type="text" id="question" placeholder="Ask Jim about success, goals, discipline, motivation..." maxlength="300">
-            <button onclick="askJim()">Ask Jim</button>
-        </div>
-        <div class="stats">Conversations: <span id="count">0</span></div>
-    </div>
+# The page lives in static/ so the module isn't carrying a multi-KB
+# string literal; read and pre-compress it once at import
+try:
+    with open('static/simple_web.html', 'rb') as f:
+        _HTML_BYTES = f.read()
+except OSError:
+    _HTML_BYTES = b'<h1>static/simple_web.html not found</h1>'
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9)
 
-    <script>
-        let conversationCount = 0;
-        
-        function askJim() {
-            const question = document.getElementById('question').value.trim();
-            if (!question) return;
-            
-            // Add user message
-            const chat = document.getElementById('chat');
-            const userMsg = document.createElement('div');
-            userMsg.className = 'message user';
-            userMsg.innerHTML = '<strong>You:</strong> ' + question;
-            chat.appendChild(userMsg);
-            
-            // Show loading
-            const loadingMsg = document.createElement('div');
-            loadingMsg.className = 'message jim';
-            loadingMsg.innerHTML = '<strong>Jim Rohn:</strong> <em>Thinking...</em>';
-            chat.appendChild(loadingMsg);
-            
-            // Clear input
-            document.getElementById('question').value = '';
-            chat.scrollTop = chat.scrollHeight;
-            
-            // Send request
-            fetch('/ask', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-                body: 'question=' + encodeURIComponent(question)
-            })
-            .then(response => response.text())
-            .then(response => {
-                chat.removeChild(loadingMsg);
-                const jimMsg = document.createElement('div');
-                jimMsg.className = 'message jim';
-                jimMsg.innerHTML = '<strong>Jim Rohn:</strong> ' + response;
-                chat.appendChild(jimMsg);
-                
-                conversationCount++;
-                document.getElementById('count').textContent = conversationCount;
-                chat.scrollTop = chat.scrollHeight;
-            })
-            .catch(error => {
-                chat.removeChild(loadingMsg);
-                const errorMsg = document.createElement('div');
-                errorMsg.className = 'message jim';
-                errorMsg.innerHTML = '<strong>Jim Rohn:</strong> I apologize, but I had a technical difficulty. Please try again.';
-                chat.appendChild(errorMsg);
-            });
-        }
-        
-        document.getElementById('question').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') askJim();
-        });
-    </script>
-</body>
-</html>'''
+# Reusable per-thread read buffer so each POST doesn't allocate a fresh
+# bytes object for the body
+_BUF_TLS = threading.local()
+
+# SSE frame skeletons: only the payload value needs escaping per token,
+# not a fresh dict + full dumps
+_TOKEN_FMT = 'data: {"t":%s}\n\n'
+_DONE_FMT = 'event: done\ndata: {"conversation_count":%d}\n\n'
 
 class RequestHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
+            accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = _HTML_GZ if accepts_gzip else _HTML_BYTES
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            if accepts_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(HTML_PAGE.encode())
+            self.wfile.write(body)
         else:
             self.send_response(404)
             self.end_headers()
@@ -208,20 +355,42 @@ class RequestHandler(BaseHTTPRequestHandler):
     def do_POST(self):
         if self.path == '/ask':
             content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length).decode('utf-8')
-            params = urllib.parse.parse_qs(post_data)
-            question = params.get('question', [''])[0]
-            
-            if question:
-                result = coach.ask_jim(question)
-                response = result['response']
+            buf = getattr(_BUF_TLS, 'buf', None)
+            if buf is None or len(buf) < content_length:
+                buf = _BUF_TLS.buf = bytearray(max(4096, content_length))
+            filled = 0
+            while filled < content_length:
+                n = self.rfile.readinto(memoryview(buf)[filled:content_length])
+                if not n:
+                    break
+                filled += n
+            post_data = bytes(memoryview(buf)[:filled]).decode('utf-8')
+            # The form has exactly one field; decode just that instead
+            # of building parse_qs's dict-of-lists
+            if post_data.startswith('question='):
+                question = urllib.parse.unquote_plus(post_data[9:])
             else:
-                response = "Please ask me something!"
+                question = urllib.parse.parse_qs(post_data).get('question', [''])[0]
             
+            # Stream tokens over SSE so the first words appear in about
+            # a second instead of after the whole completion
             self.send_response(200)
-            self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
-            self.wfile.write(response.encode())
+            
+            if not question:
+                self.wfile.write(b'data: ' + json.dumps({"t": "Please ask me something!"}).encode() + b'\n\n')
+                self.wfile.write(b'event: done\ndata: {}\n\n')
+                return
+            
+            try:
+                for token in coach.stream_jim(question):
+                    self.wfile.write((_TOKEN_FMT % json.dumps(token)).encode())
+                    self.wfile.flush()
+                self.wfile.write((_DONE_FMT % coach._total_count).encode())
+            except Exception:
+                self.wfile.write(b'event: error\ndata: {}\n\n')
         else:
             self.send_response(404)
             self.end_headers()
@@ -239,7 +408,10 @@ if __name__ == '__main__':
     print("=" * 50)
     
     try:
-        server = HTTPServer(('127.0.0.1', port), RequestHandler)
+        # Each request gets its own thread, so one user's multi-second
+        # GPT-4 call no longer blocks everyone else
+        server = ThreadingHTTPServer(('127.0.0.1', port), RequestHandler)
+        server.daemon_threads = True
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n👋 Goodbye! Keep growing!")
@@ -2,37 +2,85 @@
 
 import re
 
+# Compiled once at import: cleaning runs on every spoken response, and
+# re.sub with string patterns pays a cache lookup per call
+_DOTS_RE = re.compile(r'\.{2,}')
+_WS_RE = re.compile(r'\s+')
+
+# Every single-character fix (smart quotes, special dashes, punctuation
+# swaps) in one table so translate handles them in a single C-level pass
+_TRANS = str.maketrans({
+    '\u2018': "'", '\u2019': "'",    # smart single quotes
+    '\u201c': '"', '\u201d': '"',    # smart double quotes
+    '•': '-', '·': '-', '–': '-', '—': '-',
+    ':': ': ',
+    ';': '. ',
+    '&': 'and',
+})
+
+def _strip_markdown(text: str) -> str:
+    """Strip markdown in one linear scan instead of a regex pass per rule.
+    
+    Unpaired markers are left alone; paired markers keep their inner
+    text (scanned again so nested formatting is stripped too).
+    """
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == '`':
+            if text.startswith('```', i):
+                end = text.find('```', i + 3)
+                if end != -1:
+                    i = end + 3          # drop code blocks entirely
+                    continue
+            end = text.find('`', i + 1)
+            if end > i + 1:
+                out.append(text[i + 1:end])
+                i = end + 1
+                continue
+        elif ch == '*' or ch == '_':
+            marker = ch * 2 if text.startswith(ch * 2, i) else ch
+            end = text.find(marker, i + len(marker))
+            if end != -1:
+                out.append(_strip_markdown(text[i + len(marker):end]))
+                i = end + len(marker)
+                continue
+        elif ch == '[':
+            close = text.find(']', i + 1)
+            if close > i + 1 and text[close + 1:close + 2] == '(':
+                paren = text.find(')', close + 2)
+                if paren > close + 2:
+                    out.append(text[i + 1:close])  # keep link text
+                    i = paren + 1
+                    continue
+        elif ch == '#':
+            j = i + 1
+            while j < n and j - i < 6 and text[j] == '#':
+                j += 1
+            k = j
+            while k < n and text[k].isspace():
+                k += 1
+            if k > j:
+                i = k                    # drop headers
+                continue
+        out.append(ch)
+        i += 1
+    return ''.join(out)
+
 def clean_text_for_speech(text: str) -> str:
     """Clean text for better speech synthesis by removing markdown and formatting."""
     
-    # Remove markdown formatting
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Remove **bold**
-    text = re.sub(r'\*(.*?)\*', r'\1', text)      # Remove *italic*
-    text = re.sub(r'__(.*?)__', r'\1', text)      # Remove __underline__
-    text = re.sub(r'_(.*?)_', r'\1', text)        # Remove _italic_
-    
-    # Remove other markdown elements
-    text = re.sub(r'#{1,6}\s+', '', text)         # Remove headers
-    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)  # Remove code blocks
-    text = re.sub(r'`([^`]+)`', r'\1', text)      # Remove inline code
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # Remove links, keep text
-    
-    # Clean up quotation marks for speech
-    text = re.sub(r'"([^"]*)"', r'"\1"', text)    # Standardize quotes
-    text = text.replace(''', "'")                 # Convert smart quotes
-    text = text.replace(''', "'")                 # Convert smart quotes
-    text = text.replace('"', '"')                 # Convert smart quotes
-    text = text.replace('"', '"')                 # Convert smart quotes
+    # Remove markdown formatting in a single scan
+    text = _strip_markdown(text)
     
-    # Remove excessive punctuation
-    text = re.sub(r'[•·–—]', '-', text)           # Replace special dashes
-    text = re.sub(r'\.{2,}', '.', text)           # Replace multiple dots
-    text = re.sub(r'\s+', ' ', text)              # Replace multiple spaces
+    # Character-level cleanups in one translate pass
+    text = text.translate(_TRANS)
     
-    # Remove common problematic characters
-    text = text.replace(':', ': ')                # Ensure space after colons
-    text = text.replace(';', '. ')                # Replace semicolons with periods
-    text = text.replace('&', 'and')               # Replace ampersands
+    # Collapse dot runs and runs of whitespace
+    text = _DOTS_RE.sub('.', text)
+    text = _WS_RE.sub(' ', text)
     
     return text.strip()
 
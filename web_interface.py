@@ -2,56 +2,311 @@
 
 import os
 import json
+import math
+import time
+import hashlib
+import queue
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, request, jsonify, Response
 
 load_dotenv()
 
+def _load_prompt() -> str:
+    try:
+        with open('System prompt.txt', 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return """You are Jim Rohn, the legendary personal development speaker. 
+        Respond with wisdom, warmth, and practical advice in your distinctive style."""
+
+# The prompt file never changes while the server runs: read it once and
+# share one immutable system message across every request
+_BASE_PROMPT = _load_prompt()
+_SYSTEM_MSG = {"role": "system", "content": _BASE_PROMPT}
+
+# Stable key so OpenAI's server-side prompt caching can dedupe the
+# static system-prompt prefix across requests
+_PROMPT_CACHE_KEY = hashlib.sha1(_BASE_PROMPT.encode()).hexdigest()
+
+# Most questions are short coaching prompts that the mini tier answers
+# well and much faster; only involved requests go to the big model
+_DEEP_KEYWORDS = ('analyze', 'plan', 'detailed', 'step by step')
+
+def _pick_model(question: str) -> str:
+    lowered = question.lower()
+    if len(question) < 200 and not any(k in lowered for k in _DEEP_KEYWORDS):
+        return "gpt-4o-mini"
+    return "gpt-4o"
+
+class _EmbedBatcher:
+    """Coalesce embedding requests that arrive close together into one call."""
+    
+    def __init__(self, client, max_batch=16, window=0.02):
+        self.client = client
+        self.max_batch = max_batch
+        self.window = window
+        self.queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def embed(self, question):
+        future = Future()
+        self.queue.put((question, future))
+        return future.result()
+    
+    def _run(self):
+        while True:
+            items = [self.queue.get()]
+            deadline = time.time() + self.window
+            while len(items) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                result = self.client.embeddings.create(
+                    model="text-embedding-3-small",
+                    input=[q for q, _ in items]
+                )
+                for (_, future), data in zip(items, result.data):
+                    future.set_result(data.embedding)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+
 class JimRohnCoach:
     def __init__(self):
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.conversations = []
+        # Explicit keep-alive pool: completions and embeddings reuse
+        # warm TLS connections to api.openai.com instead of
+        # re-handshaking
+        self.openai_client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=30.0
+            ),
+        )
+        # Ring buffer: a long-running server shouldn't grow without
+        # bound. Older entries live on in the JSONL spill file.
+        self.conversations = deque(maxlen=int(os.getenv('CONVO_HISTORY', '1000')))
+        self._total_count = 0
+        self._log = open('conversations.jsonl', 'a', buffering=1 << 16)
+        
+        # Concurrent requests share this instance; guard shared state
+        self._lock = threading.Lock()
         
-        # Load the prompt
+        # Repeat questions skip the API entirely: LRU of response text
+        # keyed on prompt+question
+        self._cache = OrderedDict()
+        self._cache_max = 512
+        
+        # Semantic cache: rephrasings of an answered question reuse its
+        # response when the embeddings are close enough
+        self._sem_vectors = []
+        self._sem_responses = []
+        self._sem_threshold = 0.90
+        
+        # Concurrent embedding lookups within 20ms share one API call
+        self._embedder = _EmbedBatcher(self.openai_client)
+        
+        # Circuit breaker: after repeated API failures, fail fast for a
+        # while instead of pinning threads on a broken upstream
+        self._breaker = {'fails': 0, 'open_until': 0.0}
+        
+        # Persisting exchanges happens off-thread so a slow disk never
+        # stalls a response
+        self._log_q = queue.Queue(maxsize=10000)
+        self._log_dropped = 0
+        threading.Thread(target=self._log_worker, daemon=True).start()
+        self.base_prompt = _BASE_PROMPT
+    
+    def _embed(self, question: str):
+        """Unit-length embedding of the question, or None on failure."""
         try:
-            with open('System prompt.txt', 'r') as f:
-                self.base_prompt = f.read()
-        except FileNotFoundError:
-            self.base_prompt = """You are Jim Rohn, the legendary personal development speaker. 
-            Respond with wisdom, warmth, and practical advice in your distinctive style."""
+            vec = self._embedder.embed(question)
+            norm = math.sqrt(sum(v * v for v in vec))
+            return [v / norm for v in vec] if norm else None
+        except Exception:
+            return None
     
-    def ask_jim(self, question: str) -> Dict:
-        """Get Jim's response to a question."""
+    def _semantic_lookup(self, q_vec):
+        """Closest cached response at or above the similarity threshold."""
+        with self._lock:
+            entries = list(zip(self._sem_vectors, self._sem_responses))
+        best = None
+        best_sim = self._sem_threshold
+        for vec, response in entries:
+            sim = sum(a * b for a, b in zip(q_vec, vec))
+            if sim >= best_sim:
+                best_sim = sim
+                best = response
+        return best
+    
+    def _breaker_record(self, ok: bool):
+        with self._lock:
+            if ok:
+                self._breaker['fails'] = 0
+            elif self._breaker['fails'] >= 4:
+                self._breaker['open_until'] = time.time() + 30
+                self._breaker['fails'] = 0
+            else:
+                self._breaker['fails'] += 1
+    
+    def _log_worker(self):
+        """Drain queued exchanges to the JSONL log in batches."""
+        while True:
+            entries = [self._log_q.get()]
+            try:
+                while len(entries) < 100:
+                    entries.append(self._log_q.get_nowait())
+            except queue.Empty:
+                pass
+            for conversation in entries:
+                self._log.write(json.dumps(conversation) + '\n')
+            self._log.flush()
+    
+    def _record(self, question: str, jim_response: str) -> int:
+        """Store a finished exchange; returns the conversation count."""
+        conversation = {
+            "user": question,
+            "jim": jim_response,
+            "timestamp": datetime.now().isoformat()
+        }
+        with self._lock:
+            self.conversations.append(conversation)
+            self._total_count += 1
+            count = self._total_count
+        try:
+            self._log_q.put_nowait(conversation)
+        except queue.Full:
+            self._log_dropped += 1
+        return count
+    
+    def stream_jim(self, question: str):
+        """Yield Jim's response in pieces; cached answers arrive whole."""
+        cache_key = hashlib.sha1((self.base_prompt + '\x00' + question).encode()).digest()
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        
+        q_vec = None
+        if cached is None:
+            q_vec = self._embed(question)
+            if q_vec is not None:
+                cached = self._semantic_lookup(q_vec)
+        
+        if cached is not None:
+            self._record(question, cached)
+            yield cached
+            return
+        
+        if time.time() < self._breaker['open_until']:
+            raise RuntimeError("API temporarily unavailable")
+        
+        parts = []
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
+            stream = self.openai_client.chat.completions.create(
+                model=_pick_model(question),
                 messages=[
-                    {"role": "system", "content": self.base_prompt},
+                    _SYSTEM_MSG,
                     {"role": "user", "content": question}
                 ],
-                temperature=0.7
+                temperature=0.7,
+                timeout=20.0,
+                stream=True,
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
             )
+            for chunk in stream:
+                token = chunk.choices[0].delta.content or ""
+                if token:
+                    parts.append(token)
+                    yield token
+        except Exception:
+            self._breaker_record(False)
+            raise
+        self._breaker_record(True)
+        
+        jim_response = ''.join(parts)
+        with self._lock:
+            self._cache[cache_key] = jim_response
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+            if q_vec is not None:
+                self._sem_vectors.append(q_vec)
+                self._sem_responses.append(jim_response)
+                if len(self._sem_vectors) > self._cache_max:
+                    self._sem_vectors.pop(0)
+                    self._sem_responses.pop(0)
+        self._record(question, jim_response)
+    
+    def ask_jim(self, question: str) -> Dict:
+        """Get Jim's response to a question."""
+        cache_key = hashlib.sha1((self.base_prompt + '\x00' + question).encode()).digest()
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        
+        q_vec = None
+        if cached is None:
+            q_vec = self._embed(question)
+            if q_vec is not None:
+                cached = self._semantic_lookup(q_vec)
+        
+        try:
+            if cached is not None:
+                jim_response = cached
+            else:
+                if time.time() < self._breaker['open_until']:
+                    return {
+                        "success": False,
+                        "error": "circuit open",
+                        "response": "I'm having some technical difficulties right now. Give me a moment and try again."
+                    }
+                response = self.openai_client.chat.completions.create(
+                    model=_pick_model(question),
+                    messages=[
+                        _SYSTEM_MSG,
+                        {"role": "user", "content": question}
+                    ],
+                    temperature=0.7,
+                    timeout=20.0,
+                    extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
+                )
+                self._breaker_record(True)
+                
+                jim_response = response.choices[0].message.content
+                with self._lock:
+                    self._cache[cache_key] = jim_response
+                    if len(self._cache) > self._cache_max:
+                        self._cache.popitem(last=False)
+                    if q_vec is not None:
+                        self._sem_vectors.append(q_vec)
+                        self._sem_responses.append(jim_response)
+                        if len(self._sem_vectors) > self._cache_max:
+                            self._sem_vectors.pop(0)
+                            self._sem_responses.pop(0)
             
-            jim_response = response.choices[0].message.content
-            
-            # Store conversation
-            conversation = {
-                "user": question,
-                "jim": jim_response,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.conversations.append(conversation)
+            count = self._record(question, jim_response)
             
             return {
                 "success": True,
                 "response": jim_response,
-                "conversation_count": len(self.conversations)
+                "conversation_count": count
             }
             
         except Exception as e:
+            self._breaker_record(False)
             return {
                 "success": False,
                 "error": str(e),
@@ -61,214 +316,25 @@ class JimRohnCoach:
 # Initialize the coach
 coach = JimRohnCoach()
 
+# Blocking OpenAI calls run on this bounded pool so a burst of
+# questions can't pin every server thread, and stragglers time out
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv('THREAD_POOL_SIZE', '32')))
+
 # Flask app
 app = Flask(__name__)
 
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>🧠 Jim Rohn AI Coach</title>
-    <style>
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 800px; 
-            margin: 0 auto; 
-            padding: 20px; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        .container {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        }
-        h1 { 
-            color: #333; 
-            text-align: center; 
-            margin-bottom: 10px;
-        }
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 30px;
-            font-style: italic;
-        }
-        .chat-container {
-            max-height: 400px;
-            overflow-y: auto;
-            border: 1px solid #ddd;
-            padding: 20px;
-            margin-bottom: 20px;
-            border-radius: 10px;
-            background: #f9f9f9;
-        }
-        .message {
-            margin-bottom: 15px;
-            padding: 10px;
-            border-radius: 8px;
-        }
-        .user-message {
-            background: #e3f2fd;
-            border-left: 4px solid #2196F3;
-        }
-        .jim-message {
-            background: #f3e5f5;
-            border-left: 4px solid #9c27b0;
-            margin-top: 10px;
-        }
-        .input-container {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-        }
-        #question {
-            flex: 1;
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            font-size: 16px;
-        }
-        #askBtn {
-            padding: 12px 24px;
-            background: #667eea;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: bold;
-        }
-        #askBtn:hover {
-            background: #5a6fd8;
-        }
-        #askBtn:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-        }
-        .loading {
-            text-align: center;
-            color: #666;
-            font-style: italic;
-        }
-        .stats {
-            text-align: center;
-            color: #666;
-            font-size: 14px;
-            margin-top: 20px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🧠 Jim Rohn AI Coach</h1>
-        <p class="subtitle">"Success is neither magical nor mysterious. Success is the natural consequence of consistently applying basic fundamentals."</p>
-        
-        <div class="chat-container" id="chatContainer">
-            <div class="message jim-message">
-                <strong>Jim Rohn:</strong> Welcome, my friend! I'm here to help you on your journey of personal development. What's on your mind today? What challenge are you facing, or what wisdom are you seeking?
-            </div>
-        </div>
-        
-        <div class="input-container">
-            <input type="text" id="question" placeholder="Ask Jim about life, success, goals, discipline, or any challenge you're facing..." maxlength="500">
-            <button id="askBtn" onclick="askJim()">Ask Jim</button>
-        </div>
-        
-        <div class="stats" id="stats">
-            Ready to help you grow • Conversations: 0
-        </div>
-    </div>
+# Preallocated response skeletons: per-token frames only pay for
+# escaping the payload value, and fixed replies skip jsonify entirely
+_TOKEN_FMT = 'data: {"t":%s}\n\n'
+_DONE_FMT = 'event: done\ndata: {"conversation_count":%d}\n\n'
+_EMPTY_QUESTION_BODY = '{"success": false, "response": "Please ask me something!"}'
 
-    <script>
-        let conversationCount = 0;
-        
-        function askJim() {
-            const question = document.getElementById('question').value.trim();
-            if (!question) return;
-            
-            const chatContainer = document.getElementById('chatContainer');
-            const askBtn = document.getElementById('askBtn');
-            
-            // Add user message
-            const userMessage = document.createElement('div');
-            userMessage.className = 'message user-message';
-            userMessage.innerHTML = `<strong>You:</strong> ${question}`;
-            chatContainer.appendChild(userMessage);
-            
-            // Add loading message
-            const loadingMessage = document.createElement('div');
-            loadingMessage.className = 'message loading';
-            loadingMessage.innerHTML = 'Jim is thinking...';
-            chatContainer.appendChild(loadingMessage);
-            
-            // Clear input and disable button
-            document.getElementById('question').value = '';
-            askBtn.disabled = true;
-            askBtn.textContent = 'Thinking...';
-            
-            // Scroll to bottom
-            chatContainer.scrollTop = chatContainer.scrollHeight;
-            
-            // Send request
-            fetch('/ask', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({question: question})
-            })
-            .then(response => response.json())
-            .then(data => {
-                // Remove loading message
-                chatContainer.removeChild(loadingMessage);
-                
-                // Add Jim's response
-                const jimMessage = document.createElement('div');
-                jimMessage.className = 'message jim-message';
-                jimMessage.innerHTML = `<strong>Jim Rohn:</strong> ${data.response}`;
-                chatContainer.appendChild(jimMessage);
-                
-                // Update conversation count
-                conversationCount = data.conversation_count || conversationCount + 1;
-                document.getElementById('stats').textContent = `Ready to help you grow • Conversations: ${conversationCount}`;
-                
-                // Re-enable button
-                askBtn.disabled = false;
-                askBtn.textContent = 'Ask Jim';
-                
-                // Scroll to bottom
-                chatContainer.scrollTop = chatContainer.scrollHeight;
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                chatContainer.removeChild(loadingMessage);
-                
-                const errorMessage = document.createElement('div');
-                errorMessage.className = 'message jim-message';
-                errorMessage.innerHTML = `<strong>Jim Rohn:</strong> I'm having some technical difficulties right now. Please try again in a moment.`;
-                chatContainer.appendChild(errorMessage);
-                
-                askBtn.disabled = false;
-                askBtn.textContent = 'Ask Jim';
-            });
-        }
-        
-        // Allow Enter key to send message
-        document.getElementById('question').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                askJim();
-            }
-        });
-    </script>
-</body>
-</html>
-'''
 
 @app.route('/')
 def home():
-    return render_template_string(HTML_TEMPLATE)
+    # Static page: no per-request Jinja parse/render, and Flask can
+    # serve it with conditional requests and sendfile
+    return app.send_static_file('web_interface.html')
 
 @app.route('/ask', methods=['POST'])
 def ask_jim():
@@ -276,10 +342,34 @@ def ask_jim():
     question = data.get('question', '')
     
     if not question:
-        return jsonify({'success': False, 'response': 'Please ask me something!'})
+        return Response(_EMPTY_QUESTION_BODY, mimetype='application/json')
+    
+    def generate():
+        # Tokens are produced on the bounded pool and handed over
+        # through a queue, so streaming still respects the OpenAI
+        # concurrency cap
+        token_q = queue.Queue()
+        
+        def produce():
+            try:
+                for token in coach.stream_jim(question):
+                    token_q.put(token)
+                token_q.put(None)
+            except Exception as e:
+                token_q.put(e)
+        
+        EXECUTOR.submit(produce)
+        while True:
+            item = token_q.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                yield 'event: error\ndata: {}\n\n'
+                return
+            yield _TOKEN_FMT % json.dumps(item)
+        yield _DONE_FMT % coach._total_count
     
-    result = coach.ask_jim(question)
-    return jsonify(result)
+    return Response(generate(), mimetype='text/event-stream')
 
 if __name__ == '__main__':
     print("🧠 Starting Jim Rohn AI Coach...")
@@ -287,4 +377,11 @@ if __name__ == '__main__':
     print("🌐 Opening web interface at: http://localhost:8080")
     print("=" * 60)
     
-    app.run(host='0.0.0.0', port=8080, debug=False)
\ No newline at end of file
+    # Flask's dev server is single-purpose; waitress gives a real
+    # threaded server so concurrent questions don't queue. Deployed
+    # setups can also point gunicorn at web_interface:app directly.
+    try:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=8080, threads=16)
+    except ImportError:
+        app.run(host='0.0.0.0', port=8080, debug=False, threaded=True)
\ No newline at end of file